@@ -0,0 +1,75 @@
+"""Regression tests for grading exported submissions in bulk."""
+import json
+
+import pandas as pd
+import pytest
+
+from tutorial import bulk_grade
+
+ALL_RIGHT = {"q1": "The point where lines intersect", "q2": "Substitution", "q3": "No solution",
+             "q4": "Infinite solutions", "q5": "Same slope, different y-intercept", "q6": "(2, 4)", "q7": "x = 7, y = 3",
+             "q8": "9", "q9": "No solution", "q10": "Elimination"}
+
+
+def _scores(path, **options):
+    output = path.with_name("scores.csv")
+    submissions, correct = bulk_grade.grade_file(path, output, **options)
+    return submissions, correct, pd.read_csv(output, dtype={"student": str})
+
+
+def test_all_right_matches_key():
+    assert [f"test_{question}" for question in ALL_RIGHT] == list(bulk_grade.PRACTICE_TEST_KEY)
+    for question, answer in ALL_RIGHT.items():
+        kind, key = bulk_grade.PRACTICE_TEST_KEY[f"test_{question}"]
+        assert bulk_grade.grade_column(kind, key, pd.Series([answer], dtype=object)).tolist() == [True], question
+
+
+def test_csv(tmp_path):
+    path = tmp_path / "subs.csv"
+    pd.DataFrame([{"student": "a1", **ALL_RIGHT}, {"student": "a2", "q6": "(4, 2)", "q8": "9"}]).to_csv(
+        path, index=False)
+    submissions, correct, scores = _scores(path)
+    assert submissions == 2
+    assert scores["score"].tolist() == [10, 1]
+    assert scores["percent"].tolist() == [100.0, 10.0]
+    assert correct["test_q8"] == 2 and correct["test_q6"] == 1
+
+
+def test_jsonl_with_arrays_and_app_keys(tmp_path):
+    path = tmp_path / "subs.jsonl"
+    rows = [{"student": "j1", "test_q6": "(2, 4)"}, {"student": "j2", "test_q6": [2, 4]},
+            {"student": "j3", "test_q6": [2, [4]], "test_q1": {"bad": 1}}, {"student": "j4", "test_q8": 9}]
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    _, _, scores = _scores(path)
+    assert scores["test_q6"].tolist() == [1, 1, 0, 0]
+    assert scores["test_q8"].tolist() == [0, 0, 0, 1]
+
+
+def test_missing_columns_score_zero(tmp_path):
+    path = tmp_path / "subs.csv"
+    pd.DataFrame([{"email": "b@x", "q7": "(7, 3)"}]).to_csv(path, index=False)
+    _, _, scores = _scores(path, id_column="student")
+    assert scores["score"].tolist() == [1]
+    assert scores.filter(like="test_").sum().sum() == 1
+    _, _, scores = _scores(path, id_column="email")
+    assert scores["email"].tolist() == ["b@x"]
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 1000])
+def test_chunks_give_the_same_scores(tmp_path, chunksize):
+    path = tmp_path / "subs.jsonl"
+    rows = [{"student": f"s{number}", "q6": "(2, 4)" if number % 2 else "(4, 2)", "q8": number + 7}
+            for number in range(5)]
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    submissions, correct, scores = _scores(path, chunksize=chunksize)
+    assert submissions == 5
+    assert scores["student"].tolist() == [f"s{number}" for number in range(5)]
+    assert scores["test_q6"].tolist() == [0, 1, 0, 1, 0]
+    assert correct == {**dict.fromkeys(bulk_grade.PRACTICE_TEST_KEY, 0), "test_q6": 2, "test_q8": 1}
+
+
+def test_main_prints_summary(tmp_path, capsys):
+    path = tmp_path / "subs.csv"
+    pd.DataFrame([{"student": "a1", **ALL_RIGHT}]).to_csv(path, index=False)
+    assert bulk_grade.main([str(path), "-o", str(tmp_path / "out.csv"), "--chunksize", "1"]) == 0
+    assert "1 submissions graded" in capsys.readouterr().out
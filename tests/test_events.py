@@ -0,0 +1,36 @@
+"""Regression tests for the buffered event log."""
+import json
+
+from tutorial.events import Answer, EventLog
+
+
+def _lines(directory):
+    return [json.loads(line) for path in sorted(directory.glob("events-*.jsonl"))
+            for line in path.read_text().splitlines()]
+
+
+def test_flush_writes_json_lines(tmp_path):
+    log = EventLog(tmp_path)
+    log.log(Answer(1.0, "ada", "test_q1", "(4, 2)", True))
+    log.close()
+    assert _lines(tmp_path) == [{"type": "answer", "time": 1.0, "student": "ada", "question": "test_q1",
+                                 "response": "(4, 2)", "correct": True}]
+
+
+def test_failed_write_is_kept_and_writer_survives(tmp_path):
+    blocked = tmp_path / "events"
+    blocked.write_text("")  # A file where the directory should be: every write fails.
+    log = EventLog(blocked, capacity=3)
+    for number in range(2):
+        log.log(Answer(number, "ada", "test_q1", "", False))
+    assert log._writer.flush() == 0
+    for number in range(2, 4):
+        log.log(Answer(number, "ada", "test_q1", "", False))
+    assert log._writer.flush() == 0
+    assert log._writer.is_alive()
+    blocked.unlink()
+    log.flush()
+    lines = _lines(blocked)
+    assert [line["time"] for line in lines if line["type"] == "answer"] == [1, 2, 3]
+    assert [line["count"] for line in lines if line["type"] == "dropped"] == [1]
+    log.close()
@@ -0,0 +1,52 @@
+"""Regression tests for reading and grading typed answers."""
+from fractions import Fraction
+
+import pandas as pd
+import pytest
+
+from tutorial.grading import grade, grade_batch, grade_column, parse_response
+
+
+@pytest.mark.parametrize("text", ["(4, 2)", "4, 2", "[4; 2]", "(4,2)", "x = 4, y = 2", "y=2 and x=4", "4 and 2"])
+def test_pair_forms(text):
+    assert parse_response(text) == (4, 2)
+
+
+@pytest.mark.parametrize("text", ["24", "12345", "(4, 2, 1)", "(4)", "x = 4", "x = 4, x = 2", "z = 4, y = 2",
+                                  "(4, 2) maybe", "four, two", "", "(1/0, 2)",
+                                  "1.5.2", "(1.5.2)", "4-2", "x = 1.5.2"])
+def test_unreadable(text):
+    assert parse_response(text) is None
+
+
+def test_fractions_and_decimals_are_exact():
+    assert parse_response("(-1/2, 3/4)") == (Fraction(-1, 2), Fraction(3, 4))
+    assert parse_response("(0.5, .25)") == (Fraction(1, 2), Fraction(1, 4))
+    assert parse_response("(0.33, 1)") != (Fraction(1, 3), 1)
+
+
+def test_negatives():
+    assert parse_response("(-3, -7)") == (-3, -7)
+    assert parse_response("x = −3, y = +7") == (-3, 7)
+
+
+def test_triple_in_named_variables():
+    assert parse_response("z = 3, x = 1, y = 2", "xyz") == (1, 2, 3)
+
+
+def test_grade():
+    assert grade("(4, 2)", (4, 2))
+    assert grade(" x=2, y=4 ", (2, 4))
+    assert not grade("(2, 4)", (4, 2))
+    assert not grade("24", (2, 4))
+    assert grade("(0.5, 2)", (Fraction(1, 2), 2))
+
+
+def test_grade_batch():
+    verdicts = grade_batch(["(4, 2)", "42", "4,2", None, "x = 4, y = 2"], (4, 2))
+    assert verdicts.tolist() == [True, False, True, False, True]
+
+
+def test_grade_column_accepts_arrays():
+    responses = pd.Series(["(4, 2)", [4, 2], [4, [2]], {"x": 4}, None, (4, "2")], dtype=object)
+    assert grade_column("pair", (4, 2), responses).tolist() == [True, True, False, False, False, True]
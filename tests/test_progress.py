@@ -0,0 +1,34 @@
+"""Regression tests for the saved progress record."""
+from array import array
+
+from tutorial import questions
+from tutorial.canonical import SEEN_BYTES
+from tutorial.progress import Progress
+
+
+def test_round_trip():
+    progress = Progress()
+    progress.complete("graphing")
+    progress.record_test(8, 10)
+    progress.test, progress.test_bank = array("H", [3, 1, 4]), 0xDEADBEEF
+    progress.record_adaptive(1.25, True)
+    progress.record_adaptive(0.75, False)
+    progress.seen.add(12345)
+    restored = Progress.from_bytes(progress.to_bytes())
+    assert restored.is_complete("graphing")
+    assert restored.history() == [(8, 10)]
+    assert (restored.test.tolist(), restored.test_bank) == ([3, 1, 4], 0xDEADBEEF)
+    assert (restored.ability, restored.adaptive_answered, restored.adaptive_correct) == (0.75, 2, 1)
+    assert 12345 in restored.seen
+    assert len(restored.seen.to_bytes()) == SEEN_BYTES
+
+
+def test_unreadable_record_is_fresh():
+    assert Progress.from_bytes(b"not zlib").completed_count() == 0
+
+
+def test_bank_fingerprint_tracks_ids_and_order():
+    standard = questions.build_bank(questions.PRACTICE_TEST)
+    assert questions.build_bank(questions.PRACTICE_TEST).fingerprint == standard.fingerprint
+    assert questions.build_bank(questions.PRACTICE_TEST[::-1]).fingerprint != standard.fingerprint
+    assert questions.build_bank(questions.PRACTICE_TEST[:-1]).fingerprint != standard.fingerprint
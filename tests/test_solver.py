@@ -0,0 +1,73 @@
+"""Regression tests for the exact solver."""
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from tutorial import solver
+
+
+def _satisfies(rows, values):
+    return all(sum(Fraction(a) * v for a, v in zip(row, values)) == row[-1] for row in rows)
+
+
+def test_unique_integer_solution():
+    solution = solver.solve([(2, 3, 7), (3, 2, 8)])
+    assert solution.kind == solver.UNIQUE
+    assert solution.values == (2, 1)
+
+
+def test_unique_fraction_solution():
+    solution = solver.solve([(1, 1, 3), (2, -1, 1)])
+    assert solution.values == (Fraction(4, 3), Fraction(5, 3))
+
+
+def test_rational_coefficients():
+    rows = [(Fraction(1, 2), 1, 5), (1, -1, 1)]
+    solution = solver.solve(rows)
+    assert solution.kind == solver.UNIQUE
+    assert solution.values == (4, 3)
+
+
+def test_no_solution():
+    solution = solver.solve([(1, 1, 4), (2, 2, 9)])
+    assert solution.kind == solver.NO_SOLUTION
+    assert solution.values is None
+
+
+def test_infinite_solutions_span_every_solution():
+    rows = [(1, 2, 5), (2, 4, 10)]
+    solution = solver.solve(rows)
+    assert solution.kind == solver.INFINITE
+    assert solution.free == (1,)
+    for t in (-2, 0, 3):
+        point = [v + t * d for v, d in zip(solution.values, solution.directions[0])]
+        assert _satisfies(rows, point)
+
+
+def test_three_variables():
+    rows = [(1, 1, 1, 6), (2, -1, 1, 3), (1, 2, -1, 2)]
+    solution = solver.solve(rows)
+    assert solution.kind == solver.UNIQUE
+    assert solution.values == (1, 2, 3)
+
+
+def test_three_variables_dependent_rows():
+    solution = solver.solve([(1, 1, 1, 6), (1, 1, 1, 6), (2, -1, 1, 3)])
+    assert solution.kind == solver.INFINITE
+    assert solution.free == (2,)
+
+
+@pytest.mark.parametrize("size", [2, 3, 4])
+def test_solve_batch_matches_solve(size):
+    rng = np.random.default_rng(size)
+    A = rng.integers(-4, 5, (400, size, size))
+    # Make a quarter of the systems singular by repeating a scaled row.
+    A[::4, -1] = 2 * A[::4, 0]
+    b = rng.integers(-10, 11, (400, size))
+    kind, num, den = solver.solve_batch(A, b)
+    for k in range(len(A)):
+        expected = solver.solve([tuple(A[k, i]) + (b[k, i],) for i in range(size)])
+        assert kind[k] == expected.kind
+        if expected.kind == solver.UNIQUE:
+            assert tuple(Fraction(int(n), int(den[k])) for n in num[k]) == expected.values
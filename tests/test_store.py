@@ -0,0 +1,56 @@
+"""Regression tests for the batched progress writer."""
+import sqlite3
+
+from tutorial.store import ProgressStore
+
+
+def test_save_then_flush(tmp_path):
+    store = ProgressStore(tmp_path / "progress.db")
+    store.save("ada", b"one")
+    store.flush()
+    assert ProgressStore(tmp_path / "progress.db").load("ada") == b"one"
+    store.close()
+
+
+def test_failed_write_is_requeued_and_writer_survives(tmp_path, monkeypatch):
+    store = ProgressStore(tmp_path / "progress.db")
+    real_connection = store._connection
+
+    def locked():
+        # A session saves again while the write is under way.
+        store.save("ada", b"new")
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(store, "_connection", locked)
+    store.save("ada", b"old")
+    store.save("bob", b"bob")
+    assert store._writer.flush() == 0
+    assert store._writer.is_alive()
+    monkeypatch.setattr(store, "_connection", real_connection)
+    assert store.flush() == 2
+    assert store.load("ada") == b"new"
+    assert store.load("bob") == b"bob"
+    store.close()
+
+
+def test_load_during_flush_sees_the_batch_being_written(tmp_path, monkeypatch):
+    store = ProgressStore(tmp_path / "progress.db")
+    store.save("ada", b"old")
+    store.flush()
+    real_connection = store._connection
+    loaded = []
+
+    def writing():
+        # A second tab opens while the new state is being committed.
+        if not loaded:
+            loaded.append(None)
+            loaded[0] = store.load("ada")
+        return real_connection()
+
+    monkeypatch.setattr(store, "_connection", writing)
+    store.save("ada", b"new")
+    assert store.flush() == 1
+    assert loaded == [b"new"]
+    monkeypatch.setattr(store, "_connection", real_connection)
+    assert store.load("ada") == b"new"
+    store.close()
@@ -0,0 +1,29 @@
+"""The worked examples in ``content/`` must agree with the exact solver."""
+import shutil
+from fractions import Fraction
+
+from tutorial import verify
+from tutorial.content import CONTENT_DIR
+
+
+def test_content_has_no_mismatches():
+    examples, mismatches = verify.verify()
+    assert examples
+    assert [(example.source, example.answer_line, example.title) for example, _ in mismatches] == []
+
+
+def test_wrong_answer_is_caught(tmp_path):
+    content = tmp_path / "content"
+    shutil.copytree(CONTENT_DIR, content)
+    path = content / "practice_problems.md"
+    text = path.read_text(encoding="utf-8")
+    assert "**Answer: (11/7, 16/7, 15/7)**" in text
+    # The answer Problem 11 stated before it was corrected.
+    path.write_text(text.replace("**Answer: (11/7, 16/7, 15/7)**", "**Answer: (11/7, 4/7, 17/7)**"),
+                    encoding="utf-8")
+    _, mismatches = verify.verify(content)
+    assert len(mismatches) == 1
+    example, computed = mismatches[0]
+    assert example.title.startswith("Problem 11")
+    assert example.answer[1] == (Fraction(11, 7), Fraction(4, 7), Fraction(17, 7))
+    assert computed[1] == (Fraction(11, 7), Fraction(16, 7), Fraction(15, 7))
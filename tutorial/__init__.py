@@ -0,0 +1 @@
+"""Support modules for the Systems of Equations tutorial app."""
@@ -0,0 +1,99 @@
+"""Adaptive practice: a Rasch ability estimate and item selection by table lookup.
+
+Under the one-parameter (Rasch) model a student of ability ``theta``
+answers an item of difficulty ``b`` correctly with probability
+``p = 1 / (1 + exp(b - theta))``, and the item tells us most about the
+student - information ``p * (1 - p)`` - when ``b`` is close to ``theta``.
+
+``build_table`` precomputes, for every ability bucket of width
+``BUCKET_WIDTH`` on ``[ABILITY_MIN, ABILITY_MAX]``, the ``TABLE_DEPTH``
+most informative items in order (ties in random order, so equally good
+items share the exposure).  ``next_item`` rounds the current estimate to
+its bucket and walks that short list, picking at random among the first
+``RANDOMESQUE`` items the student hasn't answered: a lookup, whatever the
+size of the bank.  After each answer ``update`` moves the estimate Elo
+style, by a step that shrinks as answers accumulate.
+"""
+import math
+from collections import namedtuple
+
+import streamlit as st
+
+from tutorial.lazy import lazy_import
+from tutorial.questions import load_bank
+
+np = lazy_import("numpy")
+
+ABILITY_MIN, ABILITY_MAX = -4.0, 4.0
+BUCKET_WIDTH = 0.1
+TABLE_DEPTH = 64
+# Pick among this many of the most informative unanswered items.
+RANDOMESQUE = 5
+# Elo step: FIRST_STEP for the first answer, shrinking to MIN_STEP.
+FIRST_STEP, MIN_STEP = 1.0, 0.3
+ADAPTIVE_LENGTH = 10
+
+# items (B, TABLE_DEPTH): bank positions by information per ability bucket.
+SelectionTable = namedtuple("SelectionTable", ["items"])
+
+
+def probability(theta, difficulty):
+    """Rasch probability of a correct answer."""
+    return 1 / (1 + np.exp(np.asarray(difficulty) - theta))
+
+
+def bucket(theta):
+    theta = min(max(theta, ABILITY_MIN), ABILITY_MAX)
+    return int(round((theta - ABILITY_MIN) / BUCKET_WIDTH))
+
+
+def build_table(difficulty, depth=TABLE_DEPTH, seed=0):
+    """Most informative items per ability bucket for items of ``difficulty``."""
+    difficulty = np.asarray(difficulty, dtype=float)
+    depth = min(depth, len(difficulty))
+    # Shuffle first so argsort breaks ties between equal items at random.
+    shuffle = np.random.default_rng(seed).permutation(len(difficulty))
+    grid = np.arange(bucket(ABILITY_MAX) + 1) * BUCKET_WIDTH + ABILITY_MIN
+    items = np.empty((len(grid), depth), dtype=np.int64)
+    for row, theta in enumerate(grid):
+        p = probability(theta, difficulty[shuffle])
+        information = p * (1 - p)
+        best = np.argpartition(-information, depth - 1)[:depth]
+        items[row] = shuffle[best[np.argsort(-information[best], kind="stable")]]
+    return SelectionTable(items)
+
+
+@st.cache_resource(show_spinner=False)
+def load_table():
+    """Selection table for the question bank, shared by every session."""
+    return build_table(load_bank().difficulty)
+
+
+def next_item(table, theta, answered, rng=None):
+    """Bank position of the next item for ability ``theta``, or None if the bucket is used up."""
+    rng = np.random.default_rng() if rng is None else rng
+    candidates = []
+    for item in table.items[bucket(theta)]:
+        if int(item) not in answered:
+            candidates.append(int(item))
+            if len(candidates) == RANDOMESQUE:
+                break
+    return candidates[rng.integers(len(candidates))] if candidates else None
+
+
+def update(theta, answered_count, correct, difficulty):
+    """New ability after one answer; ``answered_count`` counts earlier answers."""
+    step = max(MIN_STEP, FIRST_STEP / math.sqrt(answered_count + 1))
+    expected = 1 / (1 + math.exp(difficulty - theta))
+    return min(max(theta + step * (correct - expected), ABILITY_MIN), ABILITY_MAX)
+
+
+def ability_label(theta):
+    """Plain-language reading of an ability estimate."""
+    if theta >= 1.0:
+        return "Exam ready - you handle the hardest problems."
+    if theta >= 0.0:
+        return "Solid - keep practicing fractions and special cases."
+    if theta >= -1.0:
+        return "Getting there - review substitution and elimination."
+    return "Just starting - work through the method sections first."
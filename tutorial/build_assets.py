@@ -0,0 +1,54 @@
+"""Build the app's static assets.
+
+Usage::
+
+    python -m tutorial.build_assets
+
+Writes PNG (optimized), WebP and SVG files for each entry in
+``tutorial.figures.FIGURES`` to ``assets/figures`` plus ``manifest.json``
+mapping content hash to file names, compiles the content pack, writes the
+generated problem pool (``tutorial.pool``) and checks every worked example
+with ``tutorial.verify`` (a wrong answer fails the build).  Run it at
+image build time so the app serves figures without importing Matplotlib.
+"""
+import io
+import json
+import sys
+
+from PIL import Image
+
+from tutorial import content, pool, verify
+from tutorial.figures import ASSET_DIR, FIGURE_HASHES, FIGURES, MANIFEST
+from tutorial.plotting import render_figure
+
+
+def build(asset_dir=ASSET_DIR):
+    asset_dir.mkdir(parents=True, exist_ok=True)
+    entries = {}
+    for name, spec in FIGURES.items():
+        key = FIGURE_HASHES[name]
+        stem = f"{name}-{key}"
+
+        image = Image.open(io.BytesIO(render_figure(spec, "png")))
+        image.save(asset_dir / f"{stem}.png", optimize=True)
+        image.save(asset_dir / f"{stem}.webp", lossless=True, method=6)
+        (asset_dir / f"{stem}.svg").write_bytes(render_figure(spec, "svg"))
+
+        entries[key] = {"name": name, **{fmt: f"{stem}.{fmt}" for fmt in ("png", "webp", "svg")}}
+        print(f"{name}: {stem}")
+
+    (asset_dir / MANIFEST.name).write_text(json.dumps({"figures": entries}, indent=2))
+    # Drop files from earlier builds that no longer match a figure.
+    current = {f for entry in entries.values() for f in entry.values()}
+    for path in asset_dir.glob("*-*.*"):
+        if path.name not in current:
+            path.unlink()
+
+
+if __name__ == "__main__":
+    build()
+    content.build()
+    print(f"content pack: {content.PACK}")
+    pool.build()
+    print(f"problem pool: {pool.POOL_DIR}")
+    sys.exit(verify.main())
@@ -0,0 +1,89 @@
+"""Grade Practice Test submissions exported from paper forms or an LMS.
+
+Usage::
+
+    python -m tutorial.bulk_grade submissions.csv -o scores.csv
+    python -m tutorial.bulk_grade submissions.jsonl -o scores.csv --id-column email
+
+Each row (CSV) or line (JSONL) is one submission: a student id column plus
+one column per question, named like the app's keys (``test_q1``) or just
+``q1``; in JSONL an ordered pair may be text or an array (``[2, 4]``).
+Answers are graded against the standard test's key from the question bank
+(``tutorial.questions``), the one the app uses.  The output has the id, a
+0/1 column per question, the score and the percentage; a summary of how
+many students got each question right is printed at the end.
+
+Submissions are read and graded in chunks of ``--chunksize`` rows, one
+vectorized pass per question per chunk, and each chunk's scores are
+appended to the output before the next is read, so memory stays flat
+however long the file is.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from tutorial.grading import grade_column
+from tutorial.lazy import lazy_import
+from tutorial.questions import answer_key
+
+pd = lazy_import("pandas")
+
+CHUNK_ROWS = 50_000
+PRACTICE_TEST_KEY = answer_key()
+
+
+def read_chunks(path, chunksize=CHUNK_ROWS):
+    """Submissions in ``path`` as DataFrames of at most ``chunksize`` rows, all text."""
+    if Path(path).suffix in (".jsonl", ".ndjson", ".json"):
+        return pd.read_json(path, lines=True, chunksize=chunksize, dtype=False)
+    return pd.read_csv(path, chunksize=chunksize, dtype=str, keep_default_na=False)
+
+
+def _question_column(frame, question):
+    for name in (question, question.removeprefix("test_")):
+        if name in frame.columns:
+            return frame[name]
+    return pd.Series([None] * len(frame), index=frame.index, dtype=object)
+
+
+def grade_chunk(frame, id_column="student", key=PRACTICE_TEST_KEY):
+    """Per-question correctness (0/1), score and percentage for each submission."""
+    scores = pd.DataFrame({id_column: frame[id_column] if id_column in frame.columns else frame.index})
+    for question, (kind, answer) in key.items():
+        scores[question] = grade_column(kind, answer, _question_column(frame, question)).astype("int8")
+    scores["score"] = scores[list(key)].sum(axis=1)
+    scores["percent"] = (100 * scores["score"] / len(key)).round(1)
+    return scores
+
+
+def grade_file(path, output, id_column="student", chunksize=CHUNK_ROWS, key=PRACTICE_TEST_KEY):
+    """Grade ``path`` into ``output``; returns ``(submissions, correct count per question)``."""
+    submissions = 0
+    correct = dict.fromkeys(key, 0)
+    for number, frame in enumerate(read_chunks(path, chunksize)):
+        scores = grade_chunk(frame, id_column, key)
+        scores.to_csv(output, mode="w" if number == 0 else "a", header=number == 0, index=False)
+        submissions += len(scores)
+        for question in key:
+            correct[question] += int(scores[question].sum())
+    return submissions, correct
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grade Practice Test submissions (CSV or JSONL).")
+    parser.add_argument("submissions", help="CSV or JSONL file, one submission per row")
+    parser.add_argument("-o", "--output", default="scores.csv", help="CSV file for the scores")
+    parser.add_argument("--id-column", default="student", help="column identifying the student")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_ROWS, help="rows graded at a time")
+    args = parser.parse_args(argv)
+
+    submissions, correct = grade_file(args.submissions, args.output, args.id_column, args.chunksize)
+    print(f"{submissions} submissions graded -> {args.output}")
+    for question, count in correct.items():
+        share = 100 * count / submissions if submissions else 0
+        print(f"  {question}: {count} correct ({share:.1f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
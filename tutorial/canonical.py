@@ -0,0 +1,82 @@
+"""Hashes of systems up to scaling and order, and per-student seen-sets.
+
+Two systems count as the same problem when one is the other with its
+equations scaled or listed in a different order.  ``system_hash`` takes
+padded ``(N, 3, 4)`` integer rows (as in ``tutorial.generator``), divides
+each row by the gcd of its entries and fixes its sign so the first nonzero
+entry is positive, hashes each row, and folds the sorted row hashes into
+one 64-bit hash per system, so such systems hash alike.
+
+``SeenSet`` remembers which problems a student has met in a Bloom filter
+of ``SEEN_BYTES`` (or any other size): adding and checking a hash touch
+``SEEN_HASHES`` bits, whatever the number of attempts, and the filter fits
+in a session or a database row.  A false "seen" only skips a fresh
+problem; a problem that was seen is always reported as seen.
+"""
+from tutorial.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+SEEN_BYTES = 4096
+SEEN_HASHES = 5
+# splitmix64 constants used to mix each value into the hash.
+_MIX = (0x9E3779B97F4A7C15, 0xBF58476D1CE4E5B9, 0x94D049BB133111EB)
+
+
+def _normalized_rows(coef):
+    """Each row divided by its gcd, sign set so its first nonzero entry is positive."""
+    coef = np.asarray(coef, dtype=np.int64)
+    gcd = np.gcd.reduce(np.abs(coef), axis=2)
+    reduced = coef // np.maximum(gcd, 1)[:, :, None]
+    leading = np.take_along_axis(reduced, np.argmax(reduced != 0, axis=2)[:, :, None], axis=2)
+    return reduced * np.where(leading < 0, -1, 1)
+
+
+def _mix(values):
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(_MIX[1])
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(_MIX[2])
+    return values ^ (values >> np.uint64(31))
+
+
+def _fold(values, axis):
+    """Hash the entries of ``values`` along ``axis``, in order, to one uint64."""
+    hashes = np.zeros(np.delete(values.shape, axis), dtype=np.uint64)
+    for column in np.moveaxis(values, axis, 0):
+        hashes = _mix(hashes * np.uint64(_MIX[0]) + column)
+    return hashes
+
+
+def system_hash(coef):
+    """64-bit hash (N,) uint64 of each system's canonical form.
+
+    Rows are hashed one by one and the row hashes sorted, which orders the
+    equations as canonically as sorting the rows themselves, only faster.
+    """
+    row_hashes = _fold(_normalized_rows(coef).view(np.uint64), axis=2)
+    return _fold(np.sort(row_hashes, axis=1), axis=1)
+
+
+def _bits(value, size):
+    """Bit positions in ``size`` bits for one hash, by double hashing its two halves."""
+    value = int(value)
+    first, second = value & 0xFFFFFFFF, (value >> 32) | 1
+    return [(first + i * second) % size for i in range(SEEN_HASHES)]
+
+
+class SeenSet:
+    """Bloom filter of problem hashes one student has seen."""
+
+    def __init__(self, data=None, size=SEEN_BYTES):
+        self.bits = bytearray(data) if data else bytearray(size)
+
+    def add(self, value):
+        for bit in _bits(value, len(self.bits) * 8):
+            self.bits[bit >> 3] |= 1 << (bit & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[bit >> 3] & (1 << (bit & 7)) for bit in _bits(value, len(self.bits) * 8))
+
+    def to_bytes(self):
+        return bytes(self.bits)
@@ -0,0 +1,89 @@
+"""Batch classification of 2x2 systems: one solution, none or infinitely many.
+
+``classify(coef, rhs)`` takes stacked coefficient matrices ``(N, 2, 2)`` and
+right-hand sides ``(N, 2)`` (or a single ``(N, 2, 3)`` array of ``a, b, c``
+rows for ``ax + by = c``) and returns, in one NumPy pass, each system's kind
+(``solver.UNIQUE``, ``NO_SOLUTION`` or ``INFINITE``) with the slope and
+y-intercept of both lines.
+
+Integer input is classified exactly from the determinant and the rank
+minors of the augmented matrix.  Float input uses the same tests with a
+relative tolerance; systems close to singular are then re-tested exactly,
+in one integer pass for decimal coefficients (``0.35`` scaled by 10**6)
+and one system at a time through ``Fraction`` for anything else.
+"""
+from collections import namedtuple
+from fractions import Fraction
+
+from tutorial import solver
+from tutorial.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Float systems with |det| below this fraction of |a1*b2| + |a2*b1| are
+# re-tested exactly.
+SINGULAR_RTOL = 1e-9
+# Decimal coefficients are made exact integers by this scale.
+DECIMAL_SCALE = 10**6
+# Largest denominator used when reading other floats as fractions.
+MAX_DENOMINATOR = 10**6
+
+# kind: (N,) int8 solver codes; slope, intercept: (N, 2) floats per line,
+# slope inf and intercept nan for vertical lines.
+Classification = namedtuple("Classification", ["kind", "slope", "intercept"])
+
+
+def _split(coef, rhs):
+    coef = np.asarray(coef)
+    if rhs is None:
+        return coef[:, :, 0], coef[:, :, 1], coef[:, :, 2]
+    rhs = np.asarray(rhs)
+    return coef[:, :, 0], coef[:, :, 1], rhs
+
+
+def _kinds(a, b, c, singular):
+    """Solver codes from rank tests on the augmented matrix, given which systems are singular."""
+    # With det == 0, rank(A) is 1 unless every coefficient is 0.
+    rank_a = np.where((a != 0).any(axis=1) | (b != 0).any(axis=1), 1, 0)
+    minors_ac = a[:, 0] * c[:, 1] - a[:, 1] * c[:, 0]
+    minors_bc = b[:, 0] * c[:, 1] - b[:, 1] * c[:, 0]
+    rank_aug = np.where((minors_ac != 0) | (minors_bc != 0), 2, np.maximum(rank_a, (c != 0).any(axis=1)))
+    kind = np.where(rank_aug > rank_a, solver.NO_SOLUTION, solver.INFINITE).astype(np.int8)
+    return np.where(singular, kind, np.int8(solver.UNIQUE)).astype(np.int8)
+
+
+def _exact_kind(a, b, c):
+    rows = [[Fraction(float(a[i])).limit_denominator(MAX_DENOMINATOR),
+             Fraction(float(b[i])).limit_denominator(MAX_DENOMINATOR),
+             Fraction(float(c[i])).limit_denominator(MAX_DENOMINATOR)] for i in range(2)]
+    if not any(value for row in rows for value in row[:2]):
+        return solver.INFINITE if not any(row[2] for row in rows) else solver.NO_SOLUTION
+    return solver.solve(rows).kind
+
+
+def classify(coef, rhs=None):
+    """Classify ``N`` systems of two lines; returns a ``Classification``."""
+    a, b, c = _split(coef, rhs)
+    det = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    if np.issubdtype(det.dtype, np.integer):
+        kind = _kinds(a, b, c, det == 0)
+    else:
+        scale = np.abs(a[:, 0] * b[:, 1]) + np.abs(a[:, 1] * b[:, 0])
+        near = np.abs(det) <= SINGULAR_RTOL * scale
+        kind = _kinds(a, b, c, near)
+        near = np.flatnonzero(near)
+        scaled = np.stack([a[near], b[near], c[near]]) * DECIMAL_SCALE
+        whole = np.rint(scaled)
+        decimal = ((np.abs(scaled - whole) <= 1e-4)
+                   & (np.abs(whole) < 2**31)).all(axis=(0, 2))
+        ints = whole[:, decimal].astype(np.int64)
+        det_ints = ints[0, :, 0] * ints[1, :, 1] - ints[0, :, 1] * ints[1, :, 0]
+        kind[near[decimal]] = _kinds(ints[0], ints[1], ints[2], det_ints == 0)
+        for i in near[~decimal]:
+            kind[i] = _exact_kind(a[i], b[i], c[i])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vertical = b == 0
+        slope = np.where(vertical, np.inf, -a / np.where(vertical, 1, b))
+        intercept = np.where(vertical, np.nan, c / np.where(vertical, 1, b))
+    return Classification(kind, slope, intercept)
@@ -0,0 +1,216 @@
+"""The tutorial's content pack: section text, tables and problems as data.
+
+Section content is written in ``content/<section_id>.md``: ordinary Markdown
+split into blocks by directive comments, e.g.::
+
+    <!-- subheader -->
+    📚 Example 1: Basic Graphing
+
+    <!-- markdown -->
+    **Solve by graphing:** ...
+
+    <!-- figure: graphing_example_1 -->
+
+Block directives are ``header``, ``subheader``, ``markdown``, ``info``,
+``success``, ``warning``, ``table`` (a Markdown table), ``divider``,
+``figure: <name>`` and ``widget: <name>`` (interactive code supplied by the
+section module).  Containers are ``columns``/``column``/``end columns``,
+``expander: <title>``/``end expander`` and
+``problem: <key> | <title>``/``solution``/``end problem``.  A file may be
+split into named ``part: <name>`` lists; blocks before the first part
+belong to ``main``.  Generated content (``tutorial.traces``) may also use a
+``plot`` block, ``{"type": "plot", "equations": [...]}`` with an optional
+``"variables"`` pair for the axes, graphed on the fly.
+
+``python -m tutorial.content`` (also run by ``tutorial.build_assets``)
+compiles every source into one JSON pack.  The app loads it once per
+process; a missing or stale pack is recompiled from the sources.
+"""
+import json
+import re
+from pathlib import Path
+
+import streamlit as st
+
+from tutorial import events
+from tutorial.figures import show_figure
+from tutorial.plotting import show_system
+
+ROOT = Path(__file__).resolve().parent.parent
+CONTENT_DIR = ROOT / "content"
+PACK = ROOT / "assets" / "content_pack.json"
+PACK_VERSION = 1
+
+TEXT_BLOCKS = {"header", "subheader", "markdown", "info", "success", "warning", "table"}
+
+_DIRECTIVE = re.compile(r"^<!--\s*(end\s+)?(\w+)(?::\s*(.*?))?\s*-->$")
+
+
+def _render_table(text):
+    """Normalize a Markdown table, checking every row has the header's columns."""
+    rows = [[cell.strip() for cell in line.strip().strip("|").split("|")] for line in text.splitlines()]
+    header, body = rows[0], rows[2:]
+    for row in body:
+        if len(row) != len(header):
+            raise ValueError(f"Table row {row} does not match columns {header}")
+    lines = [header, ["---"] * len(header)] + body
+    return "\n".join("| " + " | ".join(row) + " |" for row in lines)
+
+
+def parse_source(text, name="<content>"):
+    """Parse one section source into ``{part: [blocks]}``."""
+    parts = {"main": []}
+    stack = [parts["main"]]  # Block lists being filled, innermost last.
+    containers = []  # Open container blocks, innermost last.
+    block = None  # Text block currently collecting lines.
+
+    def close_text():
+        if block is not None:
+            body = "\n".join(block.pop("lines")).strip("\n").rstrip()
+            if not body:
+                raise ValueError(f"{name}: empty {block['type']} block")
+            block["text"] = _render_table(body) if block["type"] == "table" else body
+
+    for lineno, line in enumerate(text.splitlines(), 1):
+        match = _DIRECTIVE.match(line.strip())
+        if not match:
+            if block is not None:
+                block["lines"].append(line)
+            elif line.strip():
+                raise ValueError(f"{name}:{lineno}: text outside a block")
+            continue
+
+        close_text()
+        block = None
+        end, kind, arg = match.groups()
+        where = f"{name}:{lineno}"
+
+        if end:
+            if not containers or containers[-1]["type"] != kind:
+                raise ValueError(f"{where}: unexpected end {kind}")
+            containers.pop()
+            stack.pop()
+        elif kind == "part":
+            if containers:
+                raise ValueError(f"{where}: part inside {containers[-1]['type']}")
+            stack = [parts.setdefault(arg, [])]
+        elif kind in TEXT_BLOCKS:
+            block = {"type": kind, "lines": []}
+            stack[-1].append(block)
+        elif kind == "divider":
+            stack[-1].append({"type": "divider"})
+        elif kind in ("figure", "widget"):
+            stack[-1].append({"type": kind, "name": arg})
+        elif kind == "columns":
+            containers.append({"type": "columns", "columns": []})
+            stack[-1].append(containers[-1])
+            stack.append([])
+        elif kind == "column":
+            if not containers or containers[-1]["type"] != "columns":
+                raise ValueError(f"{where}: column outside columns")
+            containers[-1]["columns"].append([])
+            stack[-1] = containers[-1]["columns"][-1]
+        elif kind == "expander":
+            containers.append({"type": "expander", "title": arg, "blocks": []})
+            stack[-1].append(containers[-1])
+            stack.append(containers[-1]["blocks"])
+        elif kind == "problem":
+            key, title = (piece.strip() for piece in arg.split("|", 1))
+            containers.append({"type": "problem", "key": key, "title": title, "statement": [], "solution": []})
+            stack[-1].append(containers[-1])
+            stack.append(containers[-1]["statement"])
+        elif kind == "solution":
+            if not containers or containers[-1]["type"] != "problem":
+                raise ValueError(f"{where}: solution outside problem")
+            stack[-1] = containers[-1]["solution"]
+        else:
+            raise ValueError(f"{where}: unknown directive {kind!r}")
+
+    close_text()
+    if containers:
+        raise ValueError(f"{name}: unclosed {containers[-1]['type']}")
+    return parts
+
+
+def compile_pack(content_dir=CONTENT_DIR):
+    return {
+        "version": PACK_VERSION,
+        "sections": {
+            path.stem: parse_source(path.read_text(encoding="utf-8"), path.name)
+            for path in sorted(content_dir.glob("*.md"))
+        },
+    }
+
+
+def build(pack_path=PACK):
+    """Compile the content sources and write the pack to ``pack_path``."""
+    pack = compile_pack()
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+    pack_path.write_text(json.dumps(pack, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    return pack
+
+
+def _pack_is_current():
+    if not PACK.exists():
+        return False
+    newest_source = max(path.stat().st_mtime for path in CONTENT_DIR.glob("*.md"))
+    return PACK.stat().st_mtime >= newest_source
+
+
+@st.cache_resource(show_spinner=False)
+def load_pack():
+    """The compiled content pack, loaded once and shared by every session."""
+    if _pack_is_current():
+        pack = json.loads(PACK.read_text(encoding="utf-8"))
+        if pack.get("version") == PACK_VERSION:
+            return pack
+    try:
+        return build()
+    except OSError:
+        # Read-only deployments still work from an in-memory compile.
+        return compile_pack()
+
+
+def section_blocks(section_id, part="main"):
+    return load_pack()["sections"][section_id][part]
+
+
+def render_blocks(blocks, widgets=None):
+    """Render content blocks; ``widgets`` maps widget names to callables."""
+    for block in blocks:
+        kind = block["type"]
+        if kind == "table":
+            st.markdown(block["text"])
+        elif kind in TEXT_BLOCKS:
+            getattr(st, kind)(block["text"])
+        elif kind == "divider":
+            st.markdown("---")
+        elif kind == "figure":
+            show_figure(block["name"])
+        elif kind == "plot":
+            show_system(block["equations"], variables=block.get("variables", "xy"))
+        elif kind == "widget":
+            widgets[block["name"]]()
+        elif kind == "columns":
+            for column, column_blocks in zip(st.columns(len(block["columns"])), block["columns"]):
+                with column:
+                    render_blocks(column_blocks, widgets)
+        elif kind == "expander":
+            with st.expander(block["title"]):
+                render_blocks(block["blocks"], widgets)
+        elif kind == "problem":
+            with st.expander(block["title"]):
+                render_blocks(block["statement"], widgets)
+                if st.checkbox("Show solution", key=block["key"], on_change=events.solution_toggled,
+                               args=(block["key"],)):
+                    render_blocks(block["solution"], widgets)
+
+
+def render_section(section_id, part="main", widgets=None):
+    """Render one part of a section from the content pack."""
+    render_blocks(section_blocks(section_id, part), widgets)
+
+
+if __name__ == "__main__":
+    pack = build()
+    print(f"Wrote {PACK} ({len(pack['sections'])} sections)")
@@ -0,0 +1,133 @@
+"""Parsing of linear equations written the way the tutorial writes them.
+
+Accepts slope-intercept form (``y = 2x - 1``), standard form
+(``2x + 3y = 12``), vertical lines (``x = 3``) and fractional or decimal
+coefficients (``(1/2)x + y = 5``, ``0.20x + 0.50y = 10.5``).  Coefficients
+are returned as exact ``Fraction`` values for ``a1*v1 + ... + an*vn = c``.
+"""
+import re
+from fractions import Fraction
+
+_NUMBER = r"\d+(?:\.\d+)?(?:/\d+(?:\.\d+)?)?"
+_TERM = re.compile(rf"([+-]?)({_NUMBER}|\(-?{_NUMBER}\))?\*?([a-z])?")
+
+
+def _number(text):
+    text = text.strip("()")
+    if "/" in text:
+        num, den = text.split("/")
+        return Fraction(num) / Fraction(den)
+    return Fraction(text)
+
+
+def _side_terms(side):
+    """Yield ``(variable or None, coefficient)`` for one side of an equation."""
+    pos = 0
+    while pos < len(side):
+        match = _TERM.match(side, pos)
+        sign, coef, var = match.groups() if match else (None, None, None)
+        if not match or (coef is None and var is None) or (pos and not sign):
+            # Every term after the first needs its sign, so "3(2)" or prose
+            # like "let x = first number" is rejected instead of misread.
+            raise ValueError(f"Cannot read term at {side[pos:]!r}")
+        value = _number(coef) if coef else Fraction(1)
+        yield var, -value if sign == "-" else value
+        pos = match.end()
+
+
+def _sides(text):
+    text = text.replace("−", "-").replace("·", "*").replace(" ", "").lower()
+    if text.count("=") != 1:
+        raise ValueError(f"Not an equation: {text!r}")
+    left, right = text.split("=")
+    if not left or not right:
+        raise ValueError(f"Not an equation: {text!r}")
+    return left, right
+
+
+def equation_variables(text):
+    """Variable letters of ``text`` in order of first appearance."""
+    seen = []
+    for side in _sides(text):
+        for var, _ in _side_terms(side):
+            if var and var not in seen:
+                seen.append(var)
+    return seen
+
+
+def parse_equation(text, variables="xy"):
+    """Parse ``text`` into ``(a1, ..., an, c)`` with ``a1*v1 + ... + an*vn = c``."""
+    coefs = dict.fromkeys(variables, Fraction(0))
+    const = Fraction(0)
+    for direction, side in zip((1, -1), _sides(text)):
+        for var, value in _side_terms(side):
+            if var is None:
+                const -= direction * value
+            elif var in coefs:
+                coefs[var] += direction * value
+            else:
+                raise ValueError(f"Unexpected variable {var!r} in {text!r}")
+    if not any(coefs.values()):
+        raise ValueError(f"No variables in {text!r}")
+    return tuple(coefs.values()) + (const,)
+
+
+def isolated_variable(text):
+    """The variable ``text`` is already solved for (``y`` in ``y = 3x + 2``), or None."""
+    left, right = _sides(text)
+    if re.fullmatch(r"[a-z]", left) and left not in right:
+        return left
+    return None
+
+
+def format_terms(terms):
+    """Join ``(body, coefficient)`` pairs as ``3x - 2y + 5``.
+
+    ``body`` is a variable, any other text to multiply (``(3x - 5)``), or
+    None for a constant.  Zero terms are dropped.
+    """
+    parts = []
+    for body, coef in terms:
+        coef = Fraction(coef)
+        if not coef:
+            continue
+        size = abs(coef)
+        if body is None:
+            text = str(size)
+        elif size == 1:
+            text = body
+        elif size.denominator == 1:
+            text = f"{size}{body}"
+        else:
+            text = f"({size}){body}"
+        parts.append(("-" if coef < 0 else "+", text))
+    if not parts:
+        return "0"
+    first_sign, first = parts[0]
+    return ("-" if first_sign == "-" else "") + first + "".join(f" {sign} {text}" for sign, text in parts[1:])
+
+
+def format_equation(row, variables="xy"):
+    """Write ``(a1, ..., an, c)`` back as text, e.g. ``2x + 3y = 12``."""
+    return f"{format_terms(zip(variables, row[:-1]))} = {Fraction(row[-1])}"
+
+
+def format_solved(row, variables, var):
+    """Write a row solved for ``var``, e.g. ``y = 3x + 2``."""
+    index = variables.index(var)
+    terms = [(other, -Fraction(coef) / row[index]) for other, coef in zip(variables, row) if other != var]
+    return f"{var} = {format_terms(terms + [(None, Fraction(row[-1]) / row[index])])}"
+
+
+def parse_system(lines):
+    """Parse several equations sharing variables; returns ``(variables, rows)``.
+
+    x, y and z keep their usual order; other letters (``a``/``c`` in a
+    ticket problem) are ordered by first appearance.
+    """
+    variables = []
+    for line in lines:
+        variables += [v for v in equation_variables(line) if v not in variables]
+    if set(variables) <= set("xyz"):
+        variables.sort()
+    return "".join(variables), [parse_equation(line, variables) for line in lines]
@@ -0,0 +1,142 @@
+"""Learning events: what students answer, reveal and complete, logged to JSONL.
+
+Each kind of event is a namedtuple in ``EVENT_TYPES``.  ``log`` appends
+one to a per-process ring buffer of ``BUFFER_EVENTS`` and returns - a
+deque append, about a microsecond - so the page never waits on the disk.
+A background thread wakes every ``FLUSH_INTERVAL`` seconds, drains the
+buffer and appends the batch as JSON lines to
+``data/events/events-<date>-<n>.jsonl``, starting a new file each day and
+whenever one passes ``ROTATE_BYTES``.  Whatever is still buffered is
+written at interpreter exit, so a graceful shutdown loses nothing.  If the
+buffer ever fills between flushes the oldest events are dropped and
+counted in the next batch's ``dropped`` record.  A batch that cannot be
+written (a full or read-only disk) is logged and kept for the next flush,
+up to ``BUFFER_EVENTS`` events; anything beyond that is counted as dropped.
+
+Set ``TUTORIAL_EVENTS`` to write the files somewhere else.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque, namedtuple
+from pathlib import Path
+
+import streamlit as st
+
+from tutorial.flusher import Flusher
+from tutorial.store import session_student
+
+EVENTS_DIR = Path(os.environ.get("TUTORIAL_EVENTS", Path(__file__).resolve().parent.parent / "data" / "events"))
+BUFFER_EVENTS = 65_536
+FLUSH_INTERVAL = 1.0
+ROTATE_BYTES = 64 * 1024 * 1024
+
+# time: Unix seconds; student: store id.  question: bank id; response: what
+# was submitted; correct: bool.  problem: the solution checkbox's key.
+Answer = namedtuple("Answer", ["time", "student", "question", "response", "correct"])
+SolutionShown = namedtuple("SolutionShown", ["time", "student", "problem"])
+SectionCompleted = namedtuple("SectionCompleted", ["time", "student", "section"])
+# Event type name (the "type" field of each line) -> its namedtuple.
+EVENT_TYPES = {"answer": Answer, "solution_shown": SolutionShown, "section_completed": SectionCompleted}
+_TYPE_NAMES = {event_type: name for name, event_type in EVENT_TYPES.items()}
+
+
+class EventLog:
+    """Ring buffer of events drained to rotating JSONL files by a writer thread."""
+
+    def __init__(self, directory=EVENTS_DIR, capacity=BUFFER_EVENTS):
+        self.directory = Path(directory)
+        self._buffer = deque(maxlen=capacity)
+        self._dropped = 0
+        self._retry = []
+        self._flush_lock = threading.Lock()
+        self._path = None
+        self._writer = Flusher(self.flush, FLUSH_INTERVAL, "event-writer")
+
+    def log(self, event):
+        """Buffer ``event``; returns at once."""
+        if len(self._buffer) == self._buffer.maxlen:
+            self._dropped += 1
+        self._buffer.append(event)
+
+    def _file(self, size):
+        """The file to append ``size`` more bytes to, rotating by day and size."""
+        day = time.strftime("%Y%m%d", time.gmtime())
+        if self._path is None or not self._path.name.startswith(f"events-{day}-") or (
+                self._path.exists() and self._path.stat().st_size + size > ROTATE_BYTES):
+            self.directory.mkdir(parents=True, exist_ok=True)
+            number = 0
+            while True:
+                path = self.directory / f"events-{day}-{number}.jsonl"
+                if not path.exists() or path.stat().st_size + size <= ROTATE_BYTES:
+                    break
+                number += 1
+            self._path = path
+        return self._path
+
+    def flush(self):
+        """Write every buffered event; returns how many were written.
+
+        If the write fails the batch is kept, oldest events first out if it
+        outgrows the buffer, and the error is raised.
+        """
+        with self._flush_lock:
+            batch, self._retry = self._retry, []
+            while self._buffer:
+                batch.append(self._buffer.popleft())
+            dropped, self._dropped = self._dropped, 0
+            if not batch and not dropped:
+                return 0
+            try:
+                lines = [json.dumps({"type": _TYPE_NAMES[type(event)], **event._asdict()}, default=str)
+                         for event in batch]
+                if dropped:
+                    lines.append(json.dumps({"type": "dropped", "time": time.time(), "count": dropped}))
+                text = "\n".join(lines) + "\n"
+                with open(self._file(len(text)), "a", encoding="utf-8") as log_file:
+                    log_file.write(text)
+            except Exception:
+                overflow = max(0, len(batch) - self._buffer.maxlen)
+                self._retry = batch[overflow:]
+                self._dropped += dropped + overflow
+                raise
+            return len(batch)
+
+    def close(self):
+        """Stop the writer after a last flush."""
+        self._writer.close()
+
+
+_log = None
+_log_lock = threading.Lock()
+
+
+def get_log():
+    """The process-wide event log, shared by every session.
+
+    A plain module global rather than ``st.cache_resource``, whose lookup
+    would cost more than logging the event.
+    """
+    global _log
+    if _log is None:
+        with _log_lock:
+            if _log is None:
+                _log = EventLog()
+    return _log
+
+
+# --- Hooks for the UI ---
+
+def answered(question_id, response, correct):
+    get_log().log(Answer(time.time(), session_student(), question_id, response, bool(correct)))
+
+
+def solution_toggled(key):
+    """``on_change`` callback for a "Show solution" checkbox; logs it being ticked."""
+    if st.session_state.get(key):
+        get_log().log(SolutionShown(time.time(), session_student(), key))
+
+
+def section_completed(section_id):
+    get_log().log(SectionCompleted(time.time(), session_student(), section_id))
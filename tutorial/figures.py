@@ -0,0 +1,108 @@
+"""The tutorial's static figures and the prebuilt asset bundle that serves them.
+
+None of these graphs depend on user input, so ``python -m tutorial.build_assets``
+renders them ahead of time into ``assets/figures`` together with a manifest
+mapping each spec's content hash to its files.  When the bundle is present
+the app serves those bytes directly and never imports Matplotlib; a missing
+or stale entry falls back to rendering through ``plot_system``.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import streamlit as st
+
+from tutorial.plotting import cached_figure, system_spec
+
+ASSET_DIR = Path(__file__).resolve().parent.parent / "assets" / "figures"
+MANIFEST = ASSET_DIR / "manifest.json"
+
+# Format served at runtime: "png" or "svg".  The bundle also carries WebP
+# copies for deployments that put the asset directory behind a static server.
+FIGURE_FORMAT = os.environ.get("TUTORIAL_FIGURE_FORMAT", "png")
+
+FIGURES = {
+    "intro_one_solution": system_spec(
+        [{"eq": "2x + y = 5", "color": "b"}, {"eq": "x - y = 1", "color": "r"}],
+        x_range=(-1, 4),
+        figsize=(8, 6),
+        legend_fontsize=10,
+        title="System of Linear Equations - One Solution",
+    ),
+    "graphing_example_1": system_spec(
+        ["y = 2x - 1", "y = -x + 5"],
+        x_range=(-1, 4),
+        linewidth=3,
+        markersize=15,
+        legend_fontsize=12,
+        title="Graphing Method Example",
+        xlim=(-1, 4),
+        ylim=(-2, 6),
+    ),
+    "graphing_example_2": system_spec(
+        [
+            {"eq": "2x + y = 6", "label": "y = -2x + 6 (from 2x + y = 6)"},
+            {"eq": "x - y = 3", "label": "y = x - 3 (from x - y = 3)"},
+        ],
+        x_range=(-1, 5),
+        linewidth=3,
+        markersize=15,
+        legend_fontsize=12,
+        title="Converting to Slope-Intercept Form",
+    ),
+    "special_parallel": system_spec(
+        ["y = 2x + 3", "y = 2x - 1"],
+        x_range=(-2, 4),
+        linewidth=3,
+        legend_fontsize=12,
+        title="No Solution - Parallel Lines",
+        texts=[{"x": 1, "y": 8, "text": "Lines never intersect!", "facecolor": "yellow"}],
+    ),
+    "special_same_line": system_spec(
+        [{"eq": "y = 3x + 2", "label": "Both equations: y = 3x + 2", "color": "purple", "linewidth": 5}],
+        x_range=(-2, 3),
+        legend_fontsize=12,
+        title="Infinite Solutions - Same Line",
+        texts=[{"x": 0, "y": 10, "text": "Lines overlap completely!", "facecolor": "lightgreen"}],
+    ),
+    "practice_problem_1": system_spec(
+        ["y = x + 1", "y = -x + 5"], x_range=(-2, 7), figsize=(8, 6), axis_labels=False,
+    ),
+}
+
+
+def figure_hash(spec):
+    """Content hash of a figure spec; the bundle's lookup key."""
+    blob = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+FIGURE_HASHES = {name: figure_hash(spec) for name, spec in FIGURES.items()}
+
+
+@st.cache_resource(show_spinner=False)
+def load_bundle(fmt=FIGURE_FORMAT):
+    """Read every bundled figure in ``fmt`` once per process, keyed by hash."""
+    if not MANIFEST.exists():
+        return {}
+    manifest = json.loads(MANIFEST.read_text())
+    return {
+        key: (ASSET_DIR / files[fmt]).read_bytes()
+        for key, files in manifest["figures"].items()
+        if fmt in files and (ASSET_DIR / files[fmt]).exists()
+    }
+
+
+def figure_bytes(name, fmt=FIGURE_FORMAT):
+    """Bytes of static figure ``name``, from the bundle when it has them."""
+    data = load_bundle(fmt).get(FIGURE_HASHES[name])
+    if data is None:
+        data = cached_figure(FIGURES[name], fmt)
+    return data
+
+
+def show_figure(name):
+    """Display static figure ``name``."""
+    data = figure_bytes(name)
+    st.image(data.decode() if FIGURE_FORMAT == "svg" else data, use_container_width=True)
@@ -0,0 +1,51 @@
+"""A background thread that writes buffered data out every few seconds.
+
+``tutorial.store`` and ``tutorial.events`` both queue work in memory and
+leave the disk to one writer thread per process.  ``Flusher`` is that
+thread: it calls a ``flush`` function every ``interval`` seconds and once
+more at interpreter exit.  A flush that raises (a locked database, a full
+or read-only disk) is logged and the thread carries on; the flush function
+is expected to keep whatever it could not write for the next attempt.
+"""
+import atexit
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class Flusher:
+    """Calls ``flush()`` every ``interval`` seconds on a daemon thread, and at exit."""
+
+    def __init__(self, flush, interval, name):
+        self._flush = flush
+        self.interval = interval
+        self.name = name
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def is_alive(self):
+        return self._thread.is_alive()
+
+    def flush(self):
+        """Flush now; returns what ``flush`` returned, or 0 if it failed."""
+        try:
+            return self._flush()
+        except Exception:
+            logger.exception("%s: flush failed, retrying in %.1f s", self.name, self.interval)
+            return 0
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self.flush()
+
+    def close(self):
+        """Stop the thread, then flush what is left."""
+        self._closed = True
+        self._wake.set()
+        self._thread.join(timeout=5)
+        return self.flush()
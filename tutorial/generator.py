@@ -0,0 +1,340 @@
+"""Random practice problems for levels 1-4, built by construction.
+
+Every problem starts from its answer: an integer solution, or a fractional
+one ``p/d`` for ``fraction_answer``.  Coefficients are then chosen so the
+system has that solution and the traits of its type.  Non-singularity is
+guaranteed by how the coefficients are built (a determinant that cannot be
+zero, or an adjustment that moves it off zero), so nothing is generated and
+thrown away.  Each type is produced for a whole batch at once with NumPy.
+
+``generate(level, count)`` returns ``Problems``: fixed-width arrays with one
+entry per problem.  Rows are padded to three equations in ``x, y, z``;
+``coef[i, r]`` holds ``(a_x, a_y, a_z, c)``.
+"""
+from collections import namedtuple
+from fractions import Fraction
+
+from tutorial import solver
+from tutorial.equations import format_equation, format_solved
+from tutorial.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+TYPES = (
+    "graphing", "substitution", "elimination",
+    "conversion", "multiplication", "word",
+    "fractions", "fraction_answer", "no_solution", "infinite",
+    "three_variables",
+)
+TYPE_INDEX = {name: index for index, name in enumerate(TYPES)}
+LEVEL_TYPES = {
+    1: ("graphing", "substitution", "elimination"),
+    2: ("conversion", "multiplication", "word"),
+    3: ("fractions", "fraction_answer", "no_solution", "infinite"),
+    4: ("word", "three_variables"),
+}
+VARIABLES = "xyz"
+# Denominators for fractional answers; prime so every nonzero residue is invertible.
+ANSWER_DENOMINATORS = (2, 3, 5, 7)
+
+# coef (N, 3, 4) int: rows a_x, a_y, a_z, c, zero-padded.
+# divisor (N, 3) int: row r is shown as coef[i, r] / divisor[i, r].
+# isolated (N, 3) int8: variable index row r is written solved for, or -1.
+# nvars (N,): 2 or 3.  num (N, 3), den (N,): the solution num / den (0 unless unique).
+# kind (N,): solver code.  level (N,), type (N,): index into TYPES.
+Problems = namedtuple("Problems", ["coef", "divisor", "isolated", "nvars", "num", "den", "kind", "level", "type"])
+
+
+# --- Random helpers ---
+
+def _nonzero(rng, limit, size):
+    """Integers in ``[-limit, limit]`` other than 0."""
+    return rng.integers(1, limit + 1, size) * rng.choice((-1, 1), size)
+
+
+def _off(values, bad):
+    """``values`` moved by one where they equal ``bad``, never landing on 0."""
+    return np.where(values == bad, np.where(values + 1 == 0, values - 1, values + 1), values)
+
+
+def _batch(rows, num, den=None, kind=solver.UNIQUE, isolated=None, divisor=None):
+    """Pack ``(N, n, n + 1)`` rows and their solution into padded arrays."""
+    count, n = rows.shape[0], rows.shape[1]
+    coef = np.zeros((count, 3, 4), dtype=np.int64)
+    coef[:, :n, :n] = rows[:, :, :n]
+    coef[:, :n, 3] = rows[:, :, n]
+    padded_num = np.zeros((count, 3), dtype=np.int64)
+    padded_num[:, :n] = num
+    fields = {
+        "coef": coef,
+        "divisor": np.ones((count, 3), dtype=np.int64),
+        "isolated": np.full((count, 3), -1, dtype=np.int8),
+        "nvars": np.full(count, n, dtype=np.int8),
+        "num": padded_num,
+        "den": np.ones(count, dtype=np.int64) if den is None else np.asarray(den, dtype=np.int64),
+        "kind": np.full(count, kind, dtype=np.int8) if np.isscalar(kind) else np.asarray(kind, dtype=np.int8),
+    }
+    if isolated is not None:
+        fields["isolated"][:, :n] = isolated
+    if divisor is not None:
+        fields["divisor"][:, :n] = divisor
+    if not np.isscalar(kind):
+        fields["num"][fields["kind"] != solver.UNIQUE] = 0
+        fields["den"][fields["kind"] != solver.UNIQUE] = 0
+    elif kind != solver.UNIQUE:
+        fields["num"][:] = 0
+        fields["den"][:] = 0
+    return fields
+
+
+def _swap_columns(rng, rows, num, isolated=None):
+    """Randomly exchange x and y so either variable plays each role."""
+    swap = rng.random(rows.shape[0]) < 0.5
+    rows[swap] = rows[swap][:, :, [1, 0, 2]]
+    num[swap] = num[swap][:, ::-1]
+    if isolated is not None:
+        isolated[swap] = np.where(isolated[swap] >= 0, 1 - isolated[swap], -1)
+    return rows, num, isolated
+
+
+def _swap_rows(rng, fields):
+    """Randomly list the two equations in either order."""
+    swap = rng.random(fields["coef"].shape[0]) < 0.5
+    for name in ("coef", "divisor", "isolated"):
+        fields[name][swap, :2] = fields[name][swap, 1::-1]
+    return fields
+
+
+def _rows(*columns):
+    """Stack per-row ``(a, b, c)`` column arrays into ``(N, 2, 3)``."""
+    return np.stack([np.stack(row, axis=1) for row in columns], axis=1).astype(np.int64)
+
+
+# --- Level 1 ---
+
+def _graphing(rng, count):
+    """Two lines in y = mx + b form crossing at a grid point."""
+    x0, y0 = rng.integers(-3, 4, count), rng.integers(-4, 5, count)
+    m1 = rng.integers(-3, 4, count)
+    m2 = m1 + _nonzero(rng, 3, count)
+    rows = _rows((-m1, np.ones(count), y0 - m1 * x0), (-m2, np.ones(count), y0 - m2 * x0))
+    return _batch(rows, np.stack([x0, y0], axis=1), isolated=np.ones((count, 2)))
+
+
+def _substitution(rng, count):
+    """One equation already solved for y."""
+    x0 = rng.integers(-4, 5, count)
+    k = _nonzero(rng, 4, count)
+    b1 = np.where(rng.random(count) < 0.5, 0, rng.integers(-5, 6, count))
+    y0 = k * x0 + b1
+    b2 = rng.integers(1, 4, count)
+    a2 = _off(_nonzero(rng, 3, count), -k * b2)
+    rows = _rows((-k, np.ones(count), b1), (a2, b2, a2 * x0 + b2 * y0))
+    isolated = np.stack([np.ones(count), np.full(count, -1)], axis=1)
+    return _swap_rows(rng, _batch(rows, np.stack([x0, y0], axis=1), isolated=isolated))
+
+
+def _elimination(rng, count):
+    """Standard form with one variable's coefficients already opposite."""
+    x0, y0 = rng.integers(-6, 7, (2, count))
+    p, r = rng.integers(1, 4, (2, count))
+    q = _nonzero(rng, 3, count)
+    rows = _rows((p, q, p * x0 + q * y0), (r, -q, r * x0 - q * y0))
+    rows, num, _ = _swap_columns(rng, rows, np.stack([x0, y0], axis=1))
+    return _batch(rows, num)
+
+
+# --- Level 2 ---
+
+def _conversion(rng, count):
+    """Standard form where a coefficient of 1 must be isolated first."""
+    x0, y0 = rng.integers(-6, 7, (2, count))
+    a1 = rng.integers(2, 5, count) * rng.choice((-1, 1), count)
+    b2 = _nonzero(rng, 3, count)
+    rows = _rows((a1, np.ones(count), a1 * x0 + y0), (np.ones(count), b2, x0 + b2 * y0))
+    rows, num, _ = _swap_columns(rng, rows, np.stack([x0, y0], axis=1))
+    return _swap_rows(rng, _batch(rows, num))
+
+
+def _multiplication(rng, count):
+    """One equation has to be scaled before anything cancels."""
+    x0, y0 = rng.integers(-6, 7, (2, count))
+    a2 = _nonzero(rng, 3, count)
+    b2 = rng.integers(1, 4, count)
+    m = rng.integers(2, 4, count) * rng.choice((-1, 1), count)
+    # |b1| > |m * b2| keeps det = -a2 * sign(m) * offset away from zero.
+    b1 = m * b2 + np.sign(m) * rng.integers(1, 3, count)
+    rows = _rows((m * a2, b1, m * a2 * x0 + b1 * y0), (a2, b2, a2 * x0 + b2 * y0))
+    rows, num, _ = _swap_columns(rng, rows, np.stack([x0, y0], axis=1))
+    return _swap_rows(rng, _batch(rows, num))
+
+
+def _number_word(rng, count):
+    """Two numbers from their sum and difference."""
+    y0 = rng.integers(1, 31, count)
+    x0 = y0 + rng.integers(1, 16, count)
+    rows = _rows((np.ones(count), np.ones(count), x0 + y0), (np.ones(count), -np.ones(count), x0 - y0))
+    # Half say "one number is D more than the other": x = y + D.
+    isolated = np.stack([np.full(count, -1), np.where(rng.random(count) < 0.5, 0, -1)], axis=1)
+    return _batch(rows, np.stack([x0, y0], axis=1), isolated=isolated)
+
+
+# --- Level 3 ---
+
+def _fractions(rng, count):
+    """Fractional coefficients such as (1/2)x + y = 5, integer answer."""
+    q1, q2 = rng.integers(2, 5, (2, count))
+    s1, s2 = rng.choice((-1, 1), (2, count))
+    b1, a2 = _nonzero(rng, 2, (2, count))
+    t, u = rng.integers(-3, 4, (2, count))
+    x0, y0 = q1 * t, q2 * u
+    r1 = s1 * t + b1 * y0
+    r2 = a2 * x0 + s2 * u
+    # Stored times the denominator: integer det s1*s2 - b1*q1*a2*q2 is never 0.
+    rows = _rows((s1, b1 * q1, q1 * r1), (a2 * q2, s2, q2 * r2))
+    return _swap_rows(rng, _batch(rows, np.stack([x0, y0], axis=1), divisor=np.stack([q1, q2], axis=1)))
+
+
+def _fraction_answer(rng, count):
+    """Integer coefficients with the fractional answer (p/d, q/d) chosen first."""
+    d = rng.choice(ANSWER_DENOMINATORS, count)
+    p = rng.integers(-10, 11, count)
+    residue = 1 + (rng.random(count) * (d - 1)).astype(np.int64)
+    q = d * rng.integers(-2, 2, count) + residue
+    inverse = np.array([[pow(r, -1, m) if m in ANSWER_DENOMINATORS and r % m else 0 for r in range(8)] for m in range(8)])
+    step = (-p * inverse[d, residue]) % d  # b = step (mod d) makes a*p + b*q divisible by d.
+    a1, a2 = _nonzero(rng, 4, (2, count))
+    b1 = (a1 * step) % d + d * rng.integers(-1, 2, count)
+    b1 = np.where(b1 == 0, d, b1)
+    b2 = (a2 * step) % d + d * rng.integers(-1, 2, count)
+    b2 = np.where(b2 == 0, d, b2)
+    # Moving b2 by d changes the determinant by a1 * d, so one choice is nonzero.
+    singular = a1 * b2 == b1 * a2
+    b2 = np.where(singular, np.where(b2 + d == 0, b2 - d, b2 + d), b2)
+    rows = _rows((a1, b1, (a1 * p + b1 * q) // d), (a2, b2, (a2 * p + b2 * q) // d))
+    return _batch(rows, np.stack([p, q], axis=1), den=d)
+
+
+def _special(rng, count, kind):
+    """Parallel (no solution) or coincident (infinite) lines."""
+    slope_form = rng.random(count) < 0.5
+    m = _nonzero(rng, 4, count)
+    a = np.where(slope_form, -m, _nonzero(rng, 4, count))
+    b = np.where(slope_form, 1, _nonzero(rng, 4, count))
+    c1 = rng.integers(-8, 9, count)
+    k = np.where(slope_form & (kind == solver.NO_SOLUTION), 1, rng.choice((2, 3, -2), count))
+    c2 = k * c1 + (_nonzero(rng, 6, count) if kind == solver.NO_SOLUTION else 0)
+    rows = _rows((a, b, c1), (k * a, k * b, c2))
+    isolated = np.stack([np.where(slope_form, 1, -1),
+                         np.where(slope_form & (k == 1), 1, -1)], axis=1)
+    return _swap_rows(rng, _batch(rows, np.zeros((count, 2)), kind=kind, isolated=isolated))
+
+
+# --- Level 4 ---
+
+def _value_word(rng, count):
+    """Counts from a total and a total value (tickets, legs, coins)."""
+    x0, y0 = rng.integers(1, 41, (2, count))
+    p = rng.integers(2, 9, count)
+    q = p + rng.integers(1, 7, count)
+    rows = _rows((np.ones(count), np.ones(count), x0 + y0), (p, q, p * x0 + q * y0))
+    return _batch(rows, np.stack([x0, y0], axis=1))
+
+
+def _three_variables(rng, count):
+    """Three equations in x, y, z; A = L @ U with a nonzero pivot product."""
+    solution = rng.integers(-4, 5, (count, 3))
+    lower = np.eye(3, dtype=np.int64) + np.tril(rng.integers(-1, 2, (count, 3, 3)), -1)
+    upper = np.triu(rng.integers(-2, 3, (count, 3, 3)), 1)
+    upper[:, [0, 1, 2], [0, 1, 2]] = _nonzero(rng, 2, (count, 3))
+    matrix = lower @ upper
+    order = np.argsort(rng.random((count, 3)), axis=1)
+    matrix = np.take_along_axis(matrix, order[:, :, None], axis=1)
+    rows = np.concatenate([matrix, (matrix @ solution[:, :, None])], axis=2)
+    return _batch(rows, solution)
+
+
+_BUILDERS = {
+    (1, "graphing"): _graphing,
+    (1, "substitution"): _substitution,
+    (1, "elimination"): _elimination,
+    (2, "conversion"): _conversion,
+    (2, "multiplication"): _multiplication,
+    (2, "word"): _number_word,
+    (3, "fractions"): _fractions,
+    (3, "fraction_answer"): _fraction_answer,
+    (3, "no_solution"): lambda rng, count: _special(rng, count, solver.NO_SOLUTION),
+    (3, "infinite"): lambda rng, count: _special(rng, count, solver.INFINITE),
+    (4, "word"): _value_word,
+    (4, "three_variables"): _three_variables,
+}
+
+
+def generate_type(level, type_name, count, rng=None):
+    """``count`` problems of one level and type."""
+    rng = np.random.default_rng() if rng is None else rng
+    fields = _BUILDERS[level, type_name](rng, count)
+    return Problems(**fields, level=np.full(count, level, dtype=np.int8),
+                    type=np.full(count, TYPE_INDEX[type_name], dtype=np.int8))
+
+
+def concatenate(batches):
+    return Problems(*(np.concatenate(arrays) for arrays in zip(*batches)))
+
+
+def generate(level, count, rng=None):
+    """``count`` problems of ``level``, each of a type drawn at random."""
+    rng = np.random.default_rng() if rng is None else rng
+    types = LEVEL_TYPES[level]
+    picks = rng.integers(len(types), size=count)
+    batches = [generate_type(level, name, int((picks == index).sum()), rng) for index, name in enumerate(types)]
+    merged = concatenate(batches)
+    # Put problems back in draw order so a single draw is any type.
+    order = np.argsort(np.argsort(picks, kind="stable"), kind="stable")
+    return Problems(*(array[order] for array in merged))
+
+
+# --- Reading one problem ---
+
+def problem_rows(problems, index):
+    """``(variables, rows, isolated)`` for one problem, rows as exact integers."""
+    n = int(problems.nvars[index])
+    variables = VARIABLES[:n]
+    rows = [tuple(int(value) for value in problems.coef[index, r, :n]) + (int(problems.coef[index, r, 3]),)
+            for r in range(n)]
+    isolated = tuple(variables[i] if i >= 0 else "" for i in problems.isolated[index, :n])
+    return variables, rows, isolated
+
+
+def problem_equations(problems, index):
+    """The equations of one problem as the student sees them."""
+    variables, rows, isolated = problem_rows(problems, index)
+    equations = []
+    for r, (row, var) in enumerate(zip(rows, isolated)):
+        shown = [Fraction(value, int(problems.divisor[index, r])) for value in row]
+        equations.append(format_solved(shown, variables, var) if var else format_equation(shown, variables))
+    return equations
+
+
+def problem_solution(problems, index):
+    """The answer as a tuple of Fractions, or None for the special cases."""
+    if problems.kind[index] != solver.UNIQUE:
+        return None
+    n = int(problems.nvars[index])
+    return tuple(Fraction(int(value), int(problems.den[index])) for value in problems.num[index, :n])
+
+
+def word_statement(problems, index):
+    """Story text for ``word`` problems, None for other types."""
+    if TYPES[problems.type[index]] != "word":
+        return None
+    total, second = int(problems.coef[index, 0, 3]), problems.coef[index, 1]
+    if problems.level[index] == 2:
+        difference = int(second[3])
+        if problems.isolated[index, 1] >= 0:
+            return (f"Two numbers sum to {total}. One number is {difference} more than the other. "
+                    "Find both numbers (x is the larger).")
+        return f"The sum of two numbers is {total}. Their difference is {difference}. Find the two numbers."
+    price_x, price_y, sales = int(second[0]), int(second[1]), int(second[3])
+    return (f"A school play sold {total} tickets, some at ${price_x} (x tickets) and the rest at "
+            f"${price_y} (y tickets), for ${sales} in all. How many of each were sold?")
@@ -0,0 +1,123 @@
+"""Grading of free-text answers to "solve the system" questions.
+
+``parse_response`` reads what a student typed as an ordered pair or triple:
+``(2, 4)``, ``2, 4``, ``[2; 4]``, ``x = 2, y = 4`` (in any order), with
+integers, fractions (``-1/2``), decimals (``0.5``) or a mix.  Anything else
+in the text - a third number, a stray word, digits run together as
+``24`` - makes the response unreadable rather than guessed at.  Values are
+exact ``Fraction``s, so ``(0.5, 2)`` and ``(1/2, 2)`` both match a key of
+``(1/2, 2)`` and nothing near it does.
+
+Parses are memoized per process (the same few wrong answers come up over
+and over), and ``grade_batch`` grades each distinct response once, so a
+column of tens of thousands of responses takes well under a second.
+
+``grade_column`` grades one question for a whole column of responses, as
+``tutorial.bulk_grade`` does with the question bank's answer key.
+"""
+import re
+from fractions import Fraction
+from functools import lru_cache
+
+from tutorial.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+RESPONSE_CACHE_SIZE = 8192
+
+_NUMBER = r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:/\d+)?"
+# A number must not start inside another, so "1.5.2" reads as nothing, not 1.5 and .2.
+_NUMBER_RE = re.compile(rf"(?<![\d.]){_NUMBER}")
+_NAMED = re.compile(rf"([a-z])\s*=\s*({_NUMBER})")
+# What may surround the values: brackets, separators and "and".
+_FILLER = re.compile(r"(?:[\s,;()\[\]{}]|\band\b)*")
+
+
+def _value(text):
+    if "/" in text:
+        num, den = text.split("/")
+        return Fraction(num) / int(den) if int(den) else None
+    return Fraction(text)
+
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def parse_response(text, variables="xy"):
+    """The values of ``text`` in ``variables`` order, or None if it can't be read."""
+    text = text.replace("−", "-").lower()
+    named = _NAMED.findall(text)
+    if named:
+        if not _FILLER.fullmatch(_NAMED.sub(" ", text)):
+            return None
+        values = dict(named)
+        if len(values) != len(named) or sorted(values) != sorted(variables):
+            return None
+        items = [values[var] for var in variables]
+    else:
+        if not _FILLER.fullmatch(_NUMBER_RE.sub(" ", text)):
+            return None
+        items = _NUMBER_RE.findall(text)
+        if len(items) != len(variables):
+            return None
+    values = tuple(_value(item) for item in items)
+    return None if None in values else values
+
+
+def grade(response, key, variables="xy"):
+    """True if ``response`` is exactly the answer ``key`` (numbers or Fractions)."""
+    return parse_response(response.strip(), variables) == tuple(Fraction(value) for value in key)
+
+
+def _values(response, variables):
+    """The values of a typed response, or of one already given as a tuple."""
+    if isinstance(response, tuple):
+        try:
+            return tuple(Fraction(value) for value in response)
+        except (TypeError, ValueError, ZeroDivisionError):
+            return None
+    return parse_response(response.strip() if isinstance(response, str) else "", variables)
+
+
+def _hashable(value):
+    """``value`` with lists made tuples (JSON arrays) and other unhashables made text."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return str(value)
+    return value
+
+
+def grade_batch(responses, key, variables="xy"):
+    """Grade many responses to one question; returns a boolean array.
+
+    A response is text to parse or a tuple of values, as a JSON array reads.
+    """
+    key = tuple(Fraction(value) for value in key)
+    verdicts = {}
+    for response in responses:
+        if response not in verdicts:
+            verdicts[response] = _values(response, variables) == key
+    return np.fromiter((verdicts[response] for response in responses), dtype=bool, count=len(responses))
+
+
+def grade_column(kind, answer, responses):
+    """Grade a pandas Series of responses to one question; returns a boolean array.
+
+    Each distinct response is graded once and the verdicts spread back by
+    its factorized code.  Lists (pairs exported as JSON arrays) count as
+    tuples.
+    """
+    if responses.dtype == object:
+        responses = responses.map(_hashable)
+    codes, uniques = pd.factorize(responses)
+    uniques = pd.Series(uniques, dtype=object)
+    if kind == "pair":
+        verdicts = grade_batch(uniques.tolist(), answer)
+    elif kind == "number":
+        verdicts = pd.to_numeric(uniques, errors="coerce").to_numpy(dtype=float) == answer
+    else:
+        verdicts = (uniques.astype("string").str.strip() == answer).fillna(False).to_numpy(dtype=bool)
+    # Missing responses have code -1, which picks the trailing False.
+    return np.append(verdicts, False)[codes]
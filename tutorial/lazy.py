@@ -0,0 +1,52 @@
+"""Deferred imports for the heavy libraries and a record of what they cost.
+
+``np = lazy_import("numpy")`` returns a stand-in module; NumPy itself is
+imported the first time an attribute is used, so sections that only render
+markdown never pay for it.  Every deferred import is timed and listed by
+``import_report`` for the debug view.
+"""
+import importlib
+import sys
+import threading
+import time
+import types
+
+# Module name -> milliseconds its first import took, in load order.
+IMPORT_TIMES = {}
+
+_lock = threading.Lock()
+
+
+def timed_import(name):
+    """Import ``name`` now, recording the time if this is its first load."""
+    if name in sys.modules:
+        return sys.modules[name]
+    with _lock:
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        IMPORT_TIMES.setdefault(name, (time.perf_counter() - start) * 1000)
+    return module
+
+
+class LazyModule(types.ModuleType):
+    """Module placeholder that imports the real module on first attribute access."""
+
+    def __getattr__(self, attr):
+        module = timed_import(self.__name__)
+        # Later lookups hit the copied attributes and skip __getattr__.
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        loaded = "loaded" if self.__name__ in sys.modules else "not loaded"
+        return f"<lazy module {self.__name__!r} ({loaded})>"
+
+
+def lazy_import(name):
+    """Module stand-in for ``name`` that defers the import until first use."""
+    return LazyModule(name)
+
+
+def import_report():
+    """``[(module, milliseconds)]`` for every deferred import so far, slowest first."""
+    return sorted(IMPORT_TIMES.items(), key=lambda item: item[1], reverse=True)
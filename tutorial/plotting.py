@@ -0,0 +1,166 @@
+"""Cached rendering for the tutorial's line plots.
+
+``plot_system`` is the single entry point for every graph in the app.  A plot
+is described by a plain spec (equations, styles, limits, annotations) and
+that spec is the cache key: identical plots are drawn once per process and
+served as image bytes to every session afterwards.  Figures are built on
+``matplotlib.figure.Figure`` directly so they never enter pyplot's global
+figure registry, and are cleared as soon as they are saved.
+"""
+import io
+
+import streamlit as st
+
+from tutorial.equations import parse_equation
+from tutorial.lazy import lazy_import
+
+np = lazy_import("numpy")
+mpl_figure = lazy_import("matplotlib.figure")
+
+# st.pyplot's resolution, capped so images are never wider than
+# MAX_WIDTH_PX: st.image downsizes anything wider on every call, while
+# images at or below it pass through untouched.
+DPI = 200
+MAX_WIDTH_PX = 1460
+
+# Upper bound on distinct rendered figures kept in memory (LRU eviction).
+FIGURE_CACHE_ENTRIES = 64
+
+DEFAULT_COLORS = ["b", "r", "g", "m", "c", "y", "k"]
+GRID_POINTS = 100
+
+
+def _number_label(value):
+    value = round(float(value), 2)
+    return str(int(value)) if value.is_integer() else f"{value:g}"
+
+
+def pairwise_intersections(coefs):
+    """Intersection points of every non-parallel pair of lines (rows ``a, b, c``)."""
+    i, j = np.triu_indices(len(coefs), k=1)
+    a1, b1, c1 = coefs[i].T
+    a2, b2, c2 = coefs[j].T
+    det = a1 * b2 - a2 * b1
+    keep = ~np.isclose(det, 0)
+    det = det[keep]
+    return np.column_stack([
+        (c1 * b2 - c2 * b1)[keep] / det,
+        (a1 * c2 - a2 * c1)[keep] / det,
+    ])
+
+
+def common_point(coefs, points):
+    """The point every line passes through, or None."""
+    if len(points) == 0 or not np.allclose(coefs[:, :2] @ points[0], coefs[:, 2]):
+        return None
+    return points[0]
+
+
+def viewport(points, margin=3):
+    """``(x_range, y_range)`` framing ``points`` with ``margin`` on every side."""
+    if len(points) == 0:
+        points = np.zeros((1, 2))
+    low, high = points.min(axis=0) - margin, points.max(axis=0) + margin
+    return (low[0], high[0]), (low[1], high[1])
+
+
+def line_grid(coefs, x_range, y_range):
+    """Evaluate every line on a shared grid in one broadcast.
+
+    Returns ``(X, Y)`` arrays of shape ``(GRID_POINTS, n_lines)``; vertical
+    lines are traced over ``y_range`` instead of ``x_range``.
+    """
+    a, b, c = coefs[:, 0], coefs[:, 1], coefs[:, 2]
+    vertical = np.isclose(b, 0)
+    t = np.linspace(0, 1, GRID_POINTS)[:, None]
+    xs = x_range[0] + t * (x_range[1] - x_range[0])
+    ys = y_range[0] + t * (y_range[1] - y_range[0])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        X = np.where(vertical, c / a, xs)
+        Y = np.where(vertical, ys, (c - a * xs) / b)
+    return X, Y
+
+
+def draw_system(ax, spec):
+    """Draw a ``plot_system`` spec onto a Matplotlib axes."""
+    lines = spec["equations"]
+    variables = spec.get("variables", "xy")
+    coefs = np.array([parse_equation(line["eq"], variables) for line in lines], dtype=float)
+    points = pairwise_intersections(coefs)
+    point = common_point(coefs, points) if spec.get("solution", True) else None
+
+    auto_x, auto_y = viewport(points)
+    X, Y = line_grid(coefs, spec.get("x_range") or auto_x, spec.get("ylim") or auto_y)
+
+    ax.set_prop_cycle(
+        color=[line.get("color", DEFAULT_COLORS[i % len(DEFAULT_COLORS)]) for i, line in enumerate(lines)],
+        linewidth=[line.get("linewidth", spec.get("linewidth", 2)) for line in lines],
+    )
+    ax.plot(X, Y, label=[line.get("label", line["eq"]) for line in lines])
+
+    if point is not None:
+        ax.plot(*point, 'go', markersize=spec.get("markersize", 12), zorder=5,
+                label=f"Solution ({_number_label(point[0])}, {_number_label(point[1])})")
+
+    ax.axhline(y=0, color='k', linewidth=0.5)
+    ax.axvline(x=0, color='k', linewidth=0.5)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=spec.get("legend_fontsize"))
+
+    if spec.get("axis_labels", True):
+        ax.set_xlabel(variables[0], fontsize=12)
+        ax.set_ylabel(variables[1], fontsize=12)
+    if "title" in spec:
+        ax.set_title(spec["title"], fontsize=14, fontweight='bold')
+    if "xlim" in spec:
+        ax.set_xlim(*spec["xlim"])
+    if "ylim" in spec:
+        ax.set_ylim(*spec["ylim"])
+
+    for note in spec.get("texts", []):
+        ax.text(note["x"], note["y"], note["text"], fontsize=12,
+                bbox=dict(boxstyle='round', facecolor=note.get("facecolor", "yellow"), alpha=0.7))
+
+
+def render_figure(spec, fmt="png"):
+    """Render ``spec`` to PNG or SVG bytes and release the Figure."""
+    figsize = spec.get("figsize", (10, 7))
+    fig = mpl_figure.Figure(figsize=figsize)
+    try:
+        draw_system(fig.subplots(), spec)
+        buf = io.BytesIO()
+        fig.savefig(buf, format=fmt, bbox_inches="tight", dpi=min(DPI, MAX_WIDTH_PX // figsize[0]))
+        return buf.getvalue()
+    finally:
+        fig.clear()
+
+
+@st.cache_data(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def cached_figure(spec, fmt="png"):
+    return render_figure(spec, fmt)
+
+
+def system_spec(equations, **options):
+    """Build the plot spec for ``equations``.
+
+    Each equation is either a string in any supported form or a dict with
+    ``eq`` plus optional ``label``, ``color`` and ``linewidth``.  Options:
+    ``x_range``, ``xlim``, ``ylim``, ``title``, ``texts``, ``figsize``,
+    ``linewidth``, ``markersize``, ``legend_fontsize``, ``axis_labels``,
+    ``solution`` (mark the common intersection, on by default) and
+    ``variables`` (the horizontal and vertical axis variables, ``"xy"`` by
+    default).
+    """
+    spec = dict(options)
+    spec["equations"] = [eq if isinstance(eq, dict) else {"eq": eq} for eq in equations]
+    return spec
+
+
+def plot_system(equations, fmt="png", **options):
+    """Image bytes for the graph of ``equations``, rendered only on a cache miss."""
+    return cached_figure(system_spec(equations, **options), fmt)
+
+
+def show_system(equations, **options):
+    """Graph ``equations`` in the app."""
+    st.image(plot_system(equations, **options), use_container_width=True)
@@ -0,0 +1,173 @@
+"""A prebuilt pool of generated practice problems, memory-mapped at runtime.
+
+``python -m tutorial.pool`` (also run by ``tutorial.build_assets``) draws
+``POOL_PER_TYPE`` problems of every level and type with
+``tutorial.generator``, checks every two-variable system's kind (one, no
+or infinitely many solutions) against ``tutorial.classify``, tags each with
+the method ``tutorial.recommend`` prefers, drops systems equivalent to one already
+drawn (same ``tutorial.canonical`` hash) and writes one fixed-width ``.npy``
+file per field to ``assets/pool``.  Rows are sorted by level, then type, and
+``offsets.npy`` holds where each ``(level, type)`` group starts, so a level's
+problems and a type's problems are both one contiguous slice.
+
+The app opens the files with ``mmap_mode="r"`` once per process: workers
+share the pages through the OS cache instead of each loading a copy, and
+drawing a problem is one random index into a slice; ``draw`` retries a
+few times to skip problems in the student's ``SeenSet``.  A missing or stale
+pool is rebuilt, or generated in memory on a read-only deployment.
+"""
+import json
+from collections import namedtuple
+from pathlib import Path
+
+import streamlit as st
+
+from tutorial import generator
+from tutorial.canonical import system_hash
+from tutorial.classify import classify
+from tutorial.lazy import lazy_import
+from tutorial.recommend import recommend_batch
+from tutorial.traces import METHODS
+
+np = lazy_import("numpy")
+
+POOL_DIR = Path(__file__).resolve().parent.parent / "assets" / "pool"
+MANIFEST = POOL_DIR / "pool.json"
+POOL_VERSION = 2
+POOL_PER_TYPE = 25_000
+# A smaller pool when it has to be generated in memory.
+FALLBACK_PER_TYPE = 2_000
+POOL_SEED = 20_240_901
+# Random draws tried before a seen problem is repeated.
+DRAW_ATTEMPTS = 20
+LEVELS = tuple(generator.LEVEL_TYPES)
+# Fixed widths on disk; build() checks every value fits.
+DTYPES = {
+    "coef": "int16", "divisor": "int8", "isolated": "int8", "nvars": "int8",
+    "num": "int16", "den": "int16", "kind": "int8", "level": "int8", "type": "int8",
+    "method": "int8", "hash": "uint64",
+}
+
+# problems: a generator.Problems of (memory-mapped) arrays; method (N,): index
+# into METHODS; hash (N,): canonical system hash; offsets: group start per
+# level * len(TYPES) + type, plus the end.
+Pool = namedtuple("Pool", ["problems", "method", "hash", "offsets"])
+
+
+def _group(level, type_index):
+    return level * len(generator.TYPES) + type_index
+
+
+def recommended_methods(problems):
+    """Index into ``METHODS`` for each problem; elimination for three variables."""
+    method = np.full(len(problems.kind), METHODS.index("elimination"), dtype=np.int8)
+    two = np.flatnonzero(problems.nvars == 2)
+    rows = problems.coef[two][:, :2, [0, 1, 3]]
+    # Fraction rows are stored scaled; the cost model reads coprime rows.
+    rows = rows // np.maximum(np.gcd.reduce(np.abs(rows), axis=2), 1)[:, :, None]
+    method[two] = recommend_batch(rows, problems.isolated[two, :2])[0]
+    return method
+
+
+def check_kinds(problems):
+    """Raise ValueError if a two-variable system's kind disagrees with ``classify``."""
+    two = np.flatnonzero(problems.nvars == 2)
+    kind = classify(problems.coef[two][:, :2, [0, 1, 3]]).kind
+    wrong = two[kind != problems.kind[two]]
+    if len(wrong):
+        raise ValueError(f"{len(wrong)} generated systems have the wrong kind, e.g. problem {wrong[0]}")
+
+
+def generate_pool(per_type=POOL_PER_TYPE, seed=POOL_SEED):
+    """A sorted, indexed pool as in-memory arrays."""
+    rng = np.random.default_rng(seed)
+    batches = [generator.generate_type(level, name, per_type, rng)
+               for level in LEVELS for name in generator.LEVEL_TYPES[level]]
+    problems = generator.concatenate(batches)
+    check_kinds(problems)
+    hashes = system_hash(problems.coef)
+    keep = np.sort(np.unique(hashes, return_index=True)[1])
+    order = keep[np.argsort(_group(problems.level[keep].astype(np.int64), problems.type[keep]), kind="stable")]
+    problems = generator.Problems(*(array[order] for array in problems))
+    keys = _group(problems.level.astype(np.int64), problems.type)
+    offsets = np.searchsorted(keys, np.arange(_group(max(LEVELS) + 1, 0) + 1))
+    return Pool(problems, recommended_methods(problems), hashes[order], offsets)
+
+
+def _fields(pool):
+    return {**pool.problems._asdict(), "method": pool.method, "hash": pool.hash}
+
+
+def build(pool_dir=POOL_DIR, per_type=POOL_PER_TYPE):
+    """Generate the pool and write it to ``pool_dir``."""
+    pool = generate_pool(per_type)
+    pool_dir.mkdir(parents=True, exist_ok=True)
+    for name, array in _fields(pool).items():
+        info = np.iinfo(DTYPES[name])
+        if array.size and (array.min() < info.min or array.max() > info.max):
+            raise ValueError(f"Pool field {name!r} does not fit {DTYPES[name]}")
+        np.save(pool_dir / f"{name}.npy", array.astype(DTYPES[name]))
+    np.save(pool_dir / "offsets.npy", pool.offsets.astype(np.int64))
+    manifest = {"version": POOL_VERSION, "count": int(len(pool.method)), "per_type": per_type}
+    (pool_dir / MANIFEST.name).write_text(json.dumps(manifest, indent=2))
+    return pool
+
+
+def _open(pool_dir):
+    fields = {name: np.load(pool_dir / f"{name}.npy", mmap_mode="r") for name in DTYPES}
+    method, hashes = fields.pop("method"), fields.pop("hash")
+    return Pool(generator.Problems(**fields), method, hashes, np.load(pool_dir / "offsets.npy"))
+
+
+def _pool_is_current(pool_dir):
+    if not (pool_dir / MANIFEST.name).exists():
+        return False
+    manifest = json.loads((pool_dir / MANIFEST.name).read_text())
+    return manifest.get("version") == POOL_VERSION
+
+
+@st.cache_resource(show_spinner=False)
+def load_pool():
+    """The problem pool, memory-mapped once and shared by every session."""
+    if _pool_is_current(POOL_DIR):
+        return _open(POOL_DIR)
+    try:
+        build()
+        return _open(POOL_DIR)
+    except OSError:
+        return generate_pool(FALLBACK_PER_TYPE)
+
+
+def group_range(pool, level, type_name=None):
+    """``(start, stop)`` of a level's problems, or of one type within it."""
+    if type_name is None:
+        return int(pool.offsets[_group(level, 0)]), int(pool.offsets[_group(level + 1, 0)])
+    group = _group(level, generator.TYPE_INDEX[type_name])
+    return int(pool.offsets[group]), int(pool.offsets[group + 1])
+
+
+def draw(pool, level, type_name=None, rng=None, seen=None):
+    """Index of a random problem of ``level`` (and ``type_name``) in O(1).
+
+    With a ``SeenSet``, problems in it are skipped and the one drawn is
+    added; after ``DRAW_ATTEMPTS`` seen draws the last one is repeated.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    start, stop = group_range(pool, level, type_name)
+    if start == stop:
+        raise ValueError(f"No level {level} {type_name or ''} problems in the pool")
+    for index in rng.integers(start, stop, DRAW_ATTEMPTS if seen is not None else 1):
+        if seen is None or pool.hash[index] not in seen:
+            break
+    if seen is not None:
+        seen.add(pool.hash[index])
+    return int(index)
+
+
+def problem_method(pool, index):
+    return METHODS[pool.method[index]]
+
+
+if __name__ == "__main__":
+    built = build()
+    print(f"problem pool: {len(built.method)} problems in {POOL_DIR}")
@@ -0,0 +1,130 @@
+"""One student's progress in a few small fields, and its byte encoding.
+
+Everything the app remembers about a student lives in one ``Progress`` in
+``st.session_state.progress``:
+
+* completed sections as a bitmask, bit ``i`` for ``SECTIONS[i]``;
+* the last full-test score and its length;
+* the last ``TEST_HISTORY`` test results in two fixed byte arrays used as a
+  ring, with the number of tests ever taken;
+* the drawn test as bank positions (``array("H")``) rather than id strings,
+  with the fingerprint of the bank they index;
+* the adaptive practice run: ability estimate, questions answered and how
+  many were right;
+* a ``SeenSet`` for the problems already drawn, at its full ``SEEN_BYTES``.
+
+``to_bytes`` packs all of it into one zlib-compressed record - under 100
+bytes for a new student, about 3 KB after a thousand problems - which
+``tutorial.store`` saves and ``from_bytes`` reads back, in this process or
+another.
+"""
+import struct
+import zlib
+from array import array
+
+from tutorial.canonical import SEEN_BYTES, SeenSet
+from tutorial.sections import SECTIONS
+
+FORMAT_VERSION = 3
+TEST_HISTORY = 20
+SECTION_BITS = {section.id: bit for bit, section in enumerate(SECTIONS)}
+# version, sections, test score, test total, tests taken, drawn test's bank
+# fingerprint, drawn test length, ability estimate, adaptive questions
+# answered, adaptive questions right.
+_HEADER = struct.Struct("<BIHHHIBfBB")
+
+
+class Progress:
+    """Sections completed, test results, adaptive practice and seen problems for one student."""
+
+    __slots__ = ("sections", "test_score", "test_total", "attempts", "scores", "totals", "test", "test_bank",
+                 "ability", "adaptive_answered", "adaptive_correct", "seen")
+
+    def __init__(self):
+        self.sections = 0
+        self.test_score = 0
+        self.test_total = 0
+        self.attempts = 0
+        self.scores = bytearray(TEST_HISTORY)
+        self.totals = bytearray(TEST_HISTORY)
+        self.test = array("H")
+        self.test_bank = 0
+        self.reset_adaptive()
+        self.seen = SeenSet()
+
+    # --- Sections ---
+
+    def complete(self, section_id):
+        self.sections |= 1 << SECTION_BITS[section_id]
+
+    def is_complete(self, section_id):
+        return bool(self.sections >> SECTION_BITS[section_id] & 1)
+
+    def completed_count(self):
+        return self.sections.bit_count()
+
+    def readiness(self):
+        """Percentage of the sections completed."""
+        return round(100 * self.completed_count() / len(SECTIONS))
+
+    # --- Tests ---
+
+    def record_test(self, score, total):
+        slot = self.attempts % TEST_HISTORY
+        self.scores[slot], self.totals[slot] = score, total
+        self.test_score, self.test_total = score, total
+        self.attempts += 1
+
+    def history(self):
+        """``[(score, total)]`` of the remembered tests, oldest first."""
+        count = min(self.attempts, TEST_HISTORY)
+        slots = [(self.attempts - count + i) % TEST_HISTORY for i in range(count)]
+        return [(self.scores[slot], self.totals[slot]) for slot in slots]
+
+    # --- Adaptive practice ---
+
+    def record_adaptive(self, ability, correct):
+        """Count one adaptive answer and keep the estimate it led to."""
+        self.ability = ability
+        self.adaptive_answered += 1
+        self.adaptive_correct += bool(correct)
+
+    def reset_adaptive(self):
+        self.ability = 0.0
+        self.adaptive_answered = 0
+        self.adaptive_correct = 0
+
+    # --- Encoding ---
+
+    def to_bytes(self):
+        header = _HEADER.pack(FORMAT_VERSION, self.sections, self.test_score, self.test_total,
+                              min(self.attempts, 0xFFFF), self.test_bank, len(self.test), self.ability,
+                              min(self.adaptive_answered, 0xFF), min(self.adaptive_correct, 0xFF))
+        return zlib.compress(header + self.scores + self.totals + self.test.tobytes() + self.seen.to_bytes())
+
+    @classmethod
+    def from_bytes(cls, data):
+        """The ``Progress`` in ``data``; a fresh one if it is unreadable or another version."""
+        progress = cls()
+        try:
+            raw = zlib.decompress(data)
+            (version, sections, score, total, attempts, test_bank, length,
+             ability, answered, correct) = _HEADER.unpack_from(raw)
+        except (zlib.error, struct.error, TypeError):
+            return progress
+        if version != FORMAT_VERSION:
+            return progress
+        offset = _HEADER.size
+        progress.sections, progress.test_score, progress.test_total, progress.attempts = (
+            sections, score, total, attempts)
+        progress.test_bank = test_bank
+        progress.ability, progress.adaptive_answered, progress.adaptive_correct = ability, answered, correct
+        progress.scores[:] = raw[offset:offset + TEST_HISTORY]
+        progress.totals[:] = raw[offset + TEST_HISTORY:offset + 2 * TEST_HISTORY]
+        offset += 2 * TEST_HISTORY
+        progress.test.frombytes(raw[offset:offset + 2 * length])
+        seen = raw[offset + 2 * length:]
+        # A filter saved at another size would hash to other bits; start it over.
+        if len(seen) == SEEN_BYTES:
+            progress.seen = SeenSet(seen)
+        return progress
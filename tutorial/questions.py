@@ -0,0 +1,215 @@
+"""The question bank: Practice Test questions as data, with an answer-key index.
+
+A ``Question`` is plain data - its kind, prompt, options and answer - and
+the test page renders whatever list of questions it is given.  Four kinds
+exist:
+
+* ``choice``: pick one of ``options``; the answer is the option's text;
+* ``classification``: one solution, no solution or infinite solutions;
+* ``pair``: type an ordered pair or triple, read by ``tutorial.grading``;
+* ``number``: enter a number.
+
+``PRACTICE_TEST`` is the standard ten-question test.  ``load_bank`` adds
+generated questions drawn from the problem pool (``tutorial.pool``), so a
+test of any length can be drawn.  ``build_bank`` indexes every answer into
+fixed arrays (an option index, a number, or an exact pair as numerators
+over a common denominator), and ``grade`` encodes one submission the same
+way and marks all its questions in one vectorized comparison.
+"""
+import math
+import zlib
+from collections import namedtuple
+from fractions import Fraction
+
+import streamlit as st
+
+from tutorial import generator, pool
+from tutorial.canonical import SeenSet
+from tutorial.classify import classify
+from tutorial.grading import parse_response
+from tutorial.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+KINDS = ("choice", "classification", "pair", "number")
+CHOICE, CLASSIFICATION, PAIR, NUMBER = range(len(KINDS))
+# In solver kind order: UNIQUE, NO_SOLUTION, INFINITE.
+CLASSIFICATIONS = ("One solution", "No solution", "Infinite solutions")
+SECTIONS = ("Multiple Choice Section", "Problem Solving Section")
+# Generated questions of each kind added to the bank, and the pool
+# (level, type) groups they are drawn from.
+GENERATED_PER_KIND = 1000
+PAIR_TYPES = ((1, "graphing"), (1, "substitution"), (1, "elimination"), (2, "conversion"),
+              (2, "multiplication"), (3, "fraction_answer"))
+CLASSIFICATION_TYPES = ((3, "fractions"), (3, "no_solution"), (3, "infinite"))
+# Starting Rasch difficulty (logits) of a generated question, by kind and pool group.
+DIFFICULTY = {
+    ("pair", 1, "graphing"): -1.0, ("pair", 1, "substitution"): -0.5, ("pair", 1, "elimination"): -0.5,
+    ("pair", 2, "conversion"): 0.0, ("pair", 2, "multiplication"): 0.5, ("pair", 3, "fraction_answer"): 1.5,
+    ("classification", 3, "fractions"): 1.0, ("classification", 3, "no_solution"): 0.5,
+    ("classification", 3, "infinite"): 0.5, ("number", 2, "word"): -0.5,
+}
+BANK_SEED = 7
+
+# id: unique key (widgets use "test_<id>"); prompt: Markdown question; label:
+# the widget's label, or None to use the numbered prompt; options: choices;
+# answer: option text, a tuple of numbers, or a number; limits: (min, max)
+# for number inputs; variables: a pair's variable names; difficulty: Rasch
+# difficulty in logits, 0 for an average item.
+Question = namedtuple("Question", ["id", "kind", "prompt", "label", "options", "answer", "section", "limits",
+                                   "variables", "difficulty"],
+                      defaults=(None, None, None, SECTIONS[1], (None, None), "xy", 0.0))
+# questions: every Question; index: id -> position; kind (Q,): KINDS index;
+# code (Q,): answer's option index; value (Q,): numeric answer; num (Q, 3),
+# den (Q,): exact pair answers; all -1, nan or 0 where not applicable;
+# difficulty (Q,): float logits; fingerprint: CRC-32 of the ids in order, to
+# tell whether positions saved against another bank still mean the same.
+Bank = namedtuple("Bank", ["questions", "index", "kind", "code", "value", "num", "den", "difficulty",
+                           "fingerprint"])
+
+PRACTICE_TEST = (
+    Question("q1", "choice", "What is the graphical representation of the solution to a system?",
+             options=("The y-intercept", "The point where lines intersect", "The slope", "The x-intercept"),
+             answer="The point where lines intersect", section=SECTIONS[0], difficulty=-1.5),
+    Question("q2", "choice", "Which method is best when one variable is already isolated?",
+             options=("Graphing", "Substitution", "Elimination", "Any method"),
+             answer="Substitution", section=SECTIONS[0], difficulty=-1.0),
+    Question("q3", "choice", "What does it mean if you get 0 = 5 when solving a system?",
+             options=("One solution", "No solution", "Infinite solutions", "Invalid equation"),
+             answer="No solution", section=SECTIONS[0], difficulty=-0.5),
+    Question("q4", "choice", "What does it mean if you get 0 = 0 when solving a system?",
+             options=("One solution", "No solution", "Infinite solutions", "Invalid equation"),
+             answer="Infinite solutions", section=SECTIONS[0], difficulty=-0.5),
+    Question("q5", "choice", "Parallel lines have:",
+             options=("Same slope, same y-intercept", "Same slope, different y-intercept", "Different slopes",
+                      "No slope"),
+             answer="Same slope, different y-intercept", section=SECTIONS[0], difficulty=-1.0),
+    Question("q6", "pair", "Solve: y = x + 2 and y = 2x", "Enter solution as (x, y):", answer=(2, 4),
+             difficulty=-0.5),
+    Question("q7", "pair", "Solve: x + y = 10 and x - y = 4", "Enter solution as (x, y):", answer=(7, 3),
+             difficulty=-0.5),
+    Question("q8", "number", "The sum of two numbers is 15. Their difference is 3. What is the larger number?",
+             "Enter the larger number:", answer=9, limits=(0, 20), difficulty=-0.5),
+    Question("q9", "classification",
+             "Does the system y = 2x + 1 and y = 2x + 5 have one solution, no solution, or infinite solutions?",
+             "Select answer:", options=CLASSIFICATIONS, answer="No solution", difficulty=0.0),
+    Question("q10", "choice", "Which method would be most efficient for: 3x + y = 7 and 3x - y = 5?",
+             "Select method:", options=("Graphing", "Substitution", "Elimination"), answer="Elimination",
+             difficulty=0.5),
+)
+
+
+# --- Generated questions ---
+
+def _system(problems, index):
+    return " and ".join(generator.problem_equations(problems, index))
+
+
+def generated_questions(problem_pool, per_kind=GENERATED_PER_KIND, seed=BANK_SEED):
+    """Pair, classification and number questions built from pool problems."""
+    rng = np.random.default_rng(seed)
+    seen = SeenSet()
+    problems = problem_pool.problems
+
+    def draw(kind, choices):
+        level, type_name = choices[rng.integers(len(choices))]
+        return pool.draw(problem_pool, level, type_name, rng, seen), DIFFICULTY[kind, level, type_name]
+
+    questions = []
+    for number in range(per_kind):
+        index, difficulty = draw("pair", PAIR_TYPES)
+        variables = generator.VARIABLES[:int(problems.nvars[index])]
+        questions.append(Question(
+            f"pair{number}", "pair", f"Solve: {_system(problems, index)}",
+            f"Enter solution as ({', '.join(variables)}):",
+            answer=generator.problem_solution(problems, index), variables=variables, difficulty=difficulty))
+    drawn = [draw("classification", CLASSIFICATION_TYPES) for _ in range(per_kind)]
+    # Answers come from classifying the systems themselves, not the generator's label.
+    kinds = classify(problems.coef[[index for index, _ in drawn]][:, :2, [0, 1, 3]]).kind
+    for number, ((index, difficulty), kind) in enumerate(zip(drawn, kinds)):
+        questions.append(Question(
+            f"class{number}", "classification",
+            f"Does the system {_system(problems, index)} have one solution, no solution, or infinite solutions?",
+            "Select answer:", options=CLASSIFICATIONS, answer=CLASSIFICATIONS[kind], difficulty=difficulty))
+    for number in range(per_kind):
+        index, difficulty = draw("number", ((2, "word"),))
+        total, difference = int(problems.coef[index, 0, 3]), int(problems.coef[index, 1, 3])
+        questions.append(Question(
+            f"number{number}", "number",
+            f"The sum of two numbers is {total}. Their difference is {difference}. What is the larger number?",
+            "Enter the larger number:", answer=int(problems.num[index, 0]), limits=(0, None),
+            difficulty=difficulty))
+    # Small groups run out of unseen problems; keep one question per prompt.
+    return list({question.prompt: question for question in reversed(questions)}.values())[::-1]
+
+
+# --- Answer-key index ---
+
+def _exact(values):
+    """Numerators over a common denominator, padded to three values."""
+    values = [Fraction(value) for value in values]
+    den = math.lcm(*(value.denominator for value in values))
+    return [int(value * den) for value in values] + [0] * (3 - len(values)), den
+
+
+def _encode(questions, responses):
+    """Responses as ``(code, value, num, den)`` arrays in the key's layout."""
+    count = len(questions)
+    code, value = np.full(count, -1), np.full(count, np.nan)
+    num, den = np.zeros((count, 3), dtype=np.int64), np.zeros(count, dtype=np.int64)
+    for position, (question, response) in enumerate(zip(questions, responses)):
+        if response is None:
+            continue
+        if question.kind in ("choice", "classification"):
+            code[position] = question.options.index(response) if response in question.options else -1
+        elif question.kind == "number":
+            try:
+                value[position] = float(response)
+            except (TypeError, ValueError):
+                pass
+        else:
+            values = response if isinstance(response, tuple) else parse_response(str(response).strip(),
+                                                                                 question.variables)
+            if values is not None:
+                num[position], den[position] = _exact(values)
+    return code, value, num, den
+
+
+def build_bank(questions):
+    """Index ``questions`` into a ``Bank``."""
+    questions = tuple(questions)
+    code, value, num, den = _encode(questions, [question.answer for question in questions])
+    kind = np.array([KINDS.index(question.kind) for question in questions], dtype=np.int8)
+    difficulty = np.array([question.difficulty for question in questions], dtype=float)
+    fingerprint = zlib.crc32("\n".join(question.id for question in questions).encode())
+    return Bank(questions, {question.id: position for position, question in enumerate(questions)},
+                kind, code, value, num, den, difficulty, fingerprint)
+
+
+@st.cache_resource(show_spinner=False)
+def load_bank():
+    """The standard test plus generated questions, shared by every session."""
+    return build_bank(PRACTICE_TEST + tuple(generated_questions(pool.load_pool())))
+
+
+def grade(bank, ids, answers):
+    """Correctness (len(ids),) of ``answers`` (id -> response) to questions ``ids``."""
+    positions = np.array([bank.index[question_id] for question_id in ids], dtype=np.int64)
+    code, value, num, den = _encode([bank.questions[p] for p in positions], [answers.get(i) for i in ids])
+    kind = bank.kind[positions]
+    pair = ((num * bank.den[positions, None] == bank.num[positions] * den[:, None]).all(axis=1) & (den > 0))
+    return np.where(kind == NUMBER, value == bank.value[positions],
+                    np.where(kind == PAIR, pair, (code == bank.code[positions]) & (code >= 0)))
+
+
+def draw_test(bank, length, rng=None):
+    """Ids of ``length`` random questions, multiple choice first."""
+    rng = np.random.default_rng() if rng is None else rng
+    picks = rng.choice(len(bank.questions), size=min(length, len(bank.questions)), replace=False)
+    chosen = [bank.questions[p] for p in picks]
+    return tuple(question.id for question in sorted(chosen, key=lambda question: SECTIONS.index(question.section)))
+
+
+def answer_key(questions=PRACTICE_TEST):
+    """``{widget key: (kind, answer)}`` for ``tutorial.grading.grade_column``."""
+    return {f"test_{question.id}": (question.kind, question.answer) for question in questions}
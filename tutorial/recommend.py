@@ -0,0 +1,169 @@
+"""Which method - graphing, substitution or elimination - suits a 2x2 system.
+
+A small cost model counts the hand arithmetic each method needs:
+
+* substitution: isolating a variable (free if it is already isolated, one
+  step for a coefficient of 1 or -1, more plus a fraction penalty
+  otherwise) and distributing it into the other equation;
+* elimination: rewriting isolated equations in standard form and scaling
+  one or both equations so a variable cancels;
+* graphing: converting each equation to ``y = mx + b`` (fractional slopes
+  or intercepts cost extra) and a large penalty when the lines do not cross
+  at a grid point that can be read off the graph.
+
+``method_costs`` evaluates whole ``(N, 2, 3)`` integer arrays at once, so a
+problem pool can be tagged offline; ``recommend`` ranks the methods for one
+system and explains the choice.
+"""
+from collections import namedtuple
+
+from tutorial.equations import isolated_variable, parse_system
+from tutorial.lazy import lazy_import
+from tutorial.traces import METHODS, ORDINALS, canonical_rows
+
+np = lazy_import("numpy")
+
+SUBSTITUTION, ELIMINATION, GRAPHING = range(3)
+
+ISOLATE_COST = 2
+FRACTION_COST = 4
+SCALE_COST = 3
+SOLVE_COST = 2
+GRAPH_COST = 3
+IMPRECISE_COST = 10
+# Graph readings are trusted inside this window.
+GRID_LIMIT = 10
+# Methods within this much of the cheapest are also good choices.
+TIE_MARGIN = 0.5
+
+# method: best method name; ranking: names cheapest first; costs: name ->
+# cost; good: every name within TIE_MARGIN of the best; reason: one sentence.
+Recommendation = namedtuple("Recommendation", ["method", "ranking", "costs", "good", "reason"])
+
+
+def _isolated_indices(isolated, count):
+    if isolated is None:
+        return np.full((count, 2), -1)
+    return np.asarray(isolated).reshape(count, 2)
+
+
+def _substitution_costs(a, c, iso):
+    """Cheapest substitution cost and its choice ``2*equation + variable``."""
+    costs = []
+    for i in (0, 1):
+        for j in (0, 1):
+            k = a[:, i, j]
+            safe = np.where(k == 0, 1, k)
+            fractions = (a[:, i, 1 - j] % safe != 0) | (c[:, i] % safe != 0)
+            isolate = np.where(iso[:, i] == j, 0,
+                               np.where(np.abs(k) == 1, 1, ISOLATE_COST + FRACTION_COST * fractions))
+            distribute = np.where(np.abs(a[:, 1 - i, j]) <= 1, 1, 2)
+            costs.append(np.where(k == 0, np.inf, isolate + distribute + SOLVE_COST))
+    costs = np.stack(costs, axis=1)
+    return costs.min(axis=1), costs.argmin(axis=1)
+
+
+def _multipliers(a, j):
+    p, q = np.abs(a[:, 0, j]), np.abs(a[:, 1, j])
+    size = np.lcm(p, q)
+    return size // np.maximum(p, 1), size // np.maximum(q, 1), (p == 0) | (q == 0)
+
+
+def _elimination_costs(a, iso):
+    """Cheapest elimination cost and the variable it eliminates."""
+    costs = []
+    for j in (0, 1):
+        mp, mo, absent = _multipliers(a, j)
+        # Adding opposites reads a little easier than subtracting equal terms.
+        same_sign = np.sign(a[:, 0, j]) == np.sign(a[:, 1, j])
+        scale = SCALE_COST * ((mp != 1).astype(int) + (mo != 1)) + 0.1 * (mp + mo) + 0.05 * same_sign
+        costs.append(np.where(absent, 0, scale))
+    costs = np.stack(costs, axis=1)
+    rearrange = (iso >= 0).sum(axis=1)
+    return costs.min(axis=1) + rearrange + 1 + SOLVE_COST, costs.argmin(axis=1)
+
+
+def _graphing_costs(a, c, iso):
+    """Graphing cost and whether the lines meet at a readable grid point."""
+    slope_den = a[:, :, 1]
+    safe = np.where(slope_den == 0, 1, slope_den)
+    fractions = (a[:, :, 0] % safe != 0) | (c % safe != 0)
+    convert = np.where(iso == 1, 0,
+                       np.where((slope_den == 0) | (np.abs(slope_den) == 1), 1,
+                                ISOLATE_COST + FRACTION_COST * fractions))
+    det = a[:, 0, 0] * a[:, 1, 1] - a[:, 0, 1] * a[:, 1, 0]
+    safe_det = np.where(det == 0, 1, det)
+    nx = c[:, 0] * a[:, 1, 1] - a[:, 0, 1] * c[:, 1]
+    ny = a[:, 0, 0] * c[:, 1] - c[:, 0] * a[:, 1, 0]
+    grid = ((nx % safe_det == 0) & (ny % safe_det == 0)
+            & (np.abs(nx) <= GRID_LIMIT * np.abs(safe_det)) & (np.abs(ny) <= GRID_LIMIT * np.abs(safe_det)))
+    readable = (det == 0) | grid
+    return convert.sum(axis=1) + GRAPH_COST + np.where(readable, 0, IMPRECISE_COST), readable
+
+
+def _evaluate(rows, isolated=None):
+    rows = np.asarray(rows, dtype=np.int64)
+    a, c = rows[:, :, :2], rows[:, :, 2]
+    iso = _isolated_indices(isolated, rows.shape[0])
+    substitution, sub_choice = _substitution_costs(a, c, iso)
+    elimination, elim_choice = _elimination_costs(a, iso)
+    graphing, readable = _graphing_costs(a, c, iso)
+    costs = np.stack([substitution, elimination, graphing], axis=1)
+    return costs, sub_choice, elim_choice, readable
+
+
+def method_costs(rows, isolated=None):
+    """Costs ``(N, 3)`` in ``METHODS`` order for integer rows ``(N, 2, 3)``.
+
+    ``isolated`` is ``(N, 2)``: for each equation the index of the variable
+    it is written solved for, or -1.
+    """
+    return _evaluate(rows, isolated)[0]
+
+
+def recommend_batch(rows, isolated=None):
+    """Index into ``METHODS`` of the cheapest method for each system, and the costs."""
+    costs = method_costs(rows, isolated)
+    return costs.argmin(axis=1), costs
+
+
+def _reason(method, row, iso, sub_choice, elim_choice, readable, variables):
+    if method == SUBSTITUTION:
+        i, j = divmod(int(sub_choice), 2)
+        v, which = variables[j], ORDINALS[i]
+        if iso[i] == j:
+            return f"{v} is already isolated in the {which} equation - perfect for substitution!"
+        if abs(row[i][j]) == 1:
+            return f"{v} has a coefficient of {row[i][j]} in the {which} equation, so it is easy to isolate."
+        return f"Isolating {v} in the {which} equation keeps the arithmetic smallest."
+    if method == ELIMINATION:
+        j = int(elim_choice)
+        v = variables[j]
+        p, q = row[0][j], row[1][j]
+        if p == q:
+            return f"The {v}-coefficients are already the same - just subtract!"
+        if p == -q:
+            return f"The {v}-coefficients are already opposites - just add!"
+        return f"A quick multiplication makes the {v}-coefficients opposites, with no fractions."
+    if not readable:
+        return "The lines don't cross at a grid point, so a graph would only estimate the answer."
+    if all(index == 1 for index in iso):
+        return "Both equations are already in y = mx + b form and the lines cross at a grid point."
+    return "Both lines are quick to graph and cross at a grid point."
+
+
+def recommend(equations):
+    """Rank the three methods for one system of two equations."""
+    variables, rows = parse_system(equations)
+    if len(variables) != 2 or len(rows) != 2:
+        raise ValueError("The recommender needs two equations in two variables")
+    rows = canonical_rows(rows)
+    iso = [variables.index(var) if var else -1 for var in (isolated_variable(line) for line in equations)]
+    costs, sub_choice, elim_choice, readable = _evaluate([rows], [iso])
+    costs = costs[0]
+    order = sorted(range(len(METHODS)), key=lambda index: (costs[index], index))
+    best = order[0]
+    good = tuple(METHODS[index] for index in order if costs[index] <= costs[best] + TIE_MARGIN)
+    reason = _reason(best, rows, iso, sub_choice[0], elim_choice[0], readable[0], variables)
+    return Recommendation(METHODS[best], tuple(METHODS[index] for index in order),
+                          {METHODS[index]: float(costs[index]) for index in range(len(METHODS))}, good, reason)
@@ -0,0 +1,132 @@
+"""The course roster, who is studying in this session, and what each session costs.
+
+The roster is a CSV file with ``id`` and ``name`` columns, ``roster.csv``
+at the repository root by default (set ``TUTORIAL_ROSTER`` to use
+another).  The student is picked in the sidebar, or by ``?student=<id>``
+in the URL; each id has its own saved progress, test history and problem
+sets (``tutorial.store``).  Without a roster anyone may use any id, and a
+session with none works as ``guest``.
+
+Streamlit keeps every session's state in the one server process, so a
+course section of several hundred students costs that many copies of it.
+``track_session`` measures this session's state on every run and files
+the size in a process-wide registry, forgetting sessions idle for
+``ACTIVE_SECONDS`` as it goes; ``session_report`` lists the ones left, for
+the debug view.
+"""
+import csv
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from tutorial.store import DEFAULT_STUDENT, student_id
+
+ROSTER_PATH = Path(os.environ.get("TUTORIAL_ROSTER", Path(__file__).resolve().parent.parent / "roster.csv"))
+# A session not run for this long is left out of the report and forgotten.
+ACTIVE_SECONDS = 15 * 60
+
+Student = namedtuple("Student", ["id", "name"])
+# student: id; size: bytes of session state; largest: [(key, bytes)] biggest
+# first; seen: time of the last run.
+SessionInfo = namedtuple("SessionInfo", ["student", "size", "largest", "seen"])
+
+
+# --- Roster ---
+
+@st.cache_resource(show_spinner=False)
+def load_roster(path=ROSTER_PATH):
+    """``{id: Student}`` from the roster CSV, in file order; empty if there is none."""
+    if not Path(path).exists():
+        return {}
+    with open(path, newline="", encoding="utf-8") as roster_file:
+        rows = [row for row in csv.DictReader(roster_file) if row.get("id", "").strip()]
+    return {row["id"].strip(): Student(row["id"].strip(), (row.get("name") or row["id"]).strip()) for row in rows}
+
+
+def current_student():
+    """The session's ``Student``; ids missing from the roster are shown as typed."""
+    sid = student_id()
+    if sid == DEFAULT_STUDENT:
+        return Student(sid, "Guest")
+    return load_roster().get(sid, Student(sid, sid))
+
+
+def first_name(student=None):
+    return (student or current_student()).name.split()[0]
+
+
+def select_student():
+    """Sidebar picker; switching students starts this session over as the new one."""
+    roster = load_roster()
+    if not roster:
+        return
+    ids = list(roster)
+    current = student_id()
+    options = ids if current in roster else [current] + ids
+    chosen = st.sidebar.selectbox("Student:", options, index=options.index(current),
+                                  format_func=lambda sid: roster[sid].name if sid in roster else sid)
+    if chosen != current:
+        for key in list(st.session_state):
+            del st.session_state[key]
+        st.query_params["student"] = chosen
+        st.rerun()
+
+
+# --- Session memory ---
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def deep_size(value, seen=None):
+    """Approximate bytes held by ``value`` and everything it refers to."""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_size(key, seen) + deep_size(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in value)
+    elif hasattr(value, "nbytes"):
+        size += int(value.nbytes)
+    elif hasattr(value, "__dict__"):
+        size += deep_size(vars(value), seen)
+    elif hasattr(value, "__slots__"):
+        size += sum(deep_size(getattr(value, slot), seen) for slot in value.__slots__ if hasattr(value, slot))
+    return size
+
+
+def track_session(keep=5):
+    """Measure this session's state and record it; returns its ``SessionInfo``."""
+    state = st.session_state.to_dict()
+    seen = set()
+    sizes = sorted(((key, deep_size(value, seen)) for key, value in state.items()), key=lambda item: -item[1])
+    info = SessionInfo(student_id(), sum(size for _, size in sizes), sizes[:keep], time.time())
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        with _sessions_lock:
+            _forget_idle(info.seen - ACTIVE_SECONDS)
+            _sessions[ctx.session_id] = info
+    return info
+
+
+def _forget_idle(cutoff):
+    """Drop sessions last run before ``cutoff``; the caller holds ``_sessions_lock``."""
+    for session_id in [sid for sid, info in _sessions.items() if info.seen < cutoff]:
+        del _sessions[session_id]
+
+
+def session_report():
+    """``[SessionInfo]`` for the sessions active in the last ``ACTIVE_SECONDS``, largest first."""
+    with _sessions_lock:
+        _forget_idle(time.time() - ACTIVE_SECONDS)
+        active = list(_sessions.values())
+    return sorted(active, key=lambda info: -info.size)
@@ -0,0 +1,38 @@
+"""Registry of tutorial sections.
+
+Each section lives in its own module under ``tutorial.sections`` with a
+``render()`` function and is registered here under a stable id.  The
+sidebar navigation is generated from ``SECTIONS``; a section's module is
+imported the first time it is opened and reused from then on.
+"""
+from collections import namedtuple
+
+from tutorial.lazy import timed_import
+
+Section = namedtuple("Section", ["id", "title", "icon"])
+
+SECTIONS = [
+    Section("introduction", "Introduction to Systems", "📖"),
+    Section("graphing", "Method 1: Graphing", "📊"),
+    Section("substitution", "Method 2: Substitution", "🔄"),
+    Section("elimination", "Method 3: Elimination", "➕"),
+    Section("special_cases", "Special Cases", "⚠️"),
+    Section("word_problems", "Word Problems", "📝"),
+    Section("choosing_method", "Choosing the Best Method", "🎯"),
+    Section("practice_problems", "Practice Problems", "💪"),
+    Section("practice_test", "Practice Test", "📋"),
+    Section("study_resources", "Study Resources", "📚"),
+    Section("exam_day_tips", "Exam Day Tips", "🎓"),
+]
+
+SECTIONS_BY_ID = {section.id: section for section in SECTIONS}
+
+
+def label(section_id):
+    section = SECTIONS_BY_ID[section_id]
+    return f"{section.icon} {section.title}"
+
+
+def render(section_id):
+    """Import section ``section_id`` on first use and render it."""
+    timed_import(f"tutorial.sections.{section_id}").render()
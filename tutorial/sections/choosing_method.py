@@ -0,0 +1,59 @@
+"""Choosing the Best Method."""
+import random
+
+import streamlit as st
+
+from tutorial import generator, pool
+from tutorial.content import render_section
+from tutorial.recommend import recommend
+from tutorial.store import save_session, session_progress
+
+PRACTICE_SYSTEMS = [
+    ("y = 4x - 3", "2x + y = 9"),
+    ("3x + 4y = 12", "3x - 2y = 6"),
+    ("y = 2x + 1", "y = -x + 7"),
+]
+# Pool levels whose problems are all two-variable systems.
+FRESH_LEVELS = (1, 2, 3)
+
+
+def render():
+    render_section("choosing_method", widgets={"method_practice": method_practice})
+
+
+@st.fragment
+def method_practice():
+    """The method-choice checks; answering one reruns only this block."""
+    for number, system in enumerate(PRACTICE_SYSTEMS, 1):
+        choice = st.radio(
+            f"**System {number}:** `{system[0]}` and `{system[1]}`",
+            ["Graphing", "Substitution", "Elimination"],
+            key=f"method{number}"
+        )
+        if st.button(f"Check Choice {number}"):
+            show_advice(choice, recommend(system))
+
+    st.markdown("---")
+    if st.button("🎲 New system", key="new_method_system"):
+        level = random.choice(FRESH_LEVELS)
+        st.session_state.method_system = pool.draw(pool.load_pool(), level, seen=session_progress().seen)
+        save_session()
+    index = st.session_state.get("method_system")
+    if index is None:
+        return
+    system = generator.problem_equations(pool.load_pool().problems, index)
+    choice = st.radio(f"**Fresh system:** `{system[0]}` and `{system[1]}`",
+                      ["Graphing", "Substitution", "Elimination"], key=f"method_fresh_{index}")
+    if st.button("Check Choice", key=f"check_fresh_{index}"):
+        show_advice(choice, recommend(system))
+
+
+def show_advice(choice, advice):
+    """Feedback on a method choice from the cost model's recommendation."""
+    if choice.lower() not in advice.good:
+        st.info(f"{advice.method.title()} would be most efficient here. {advice.reason}")
+    elif len(advice.good) > 1:
+        methods = " and ".join(method.title() for method in advice.good)
+        st.success(f"✓ Good choice! {methods} both work well here. {advice.reason}")
+    else:
+        st.success(f"✓ Best choice! {advice.reason}")
@@ -0,0 +1,6 @@
+"""Method 3: Elimination."""
+from tutorial.content import render_section
+
+
+def render():
+    render_section("elimination")
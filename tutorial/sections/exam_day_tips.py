@@ -0,0 +1,13 @@
+"""Exam Day Tips."""
+import streamlit as st
+
+from tutorial import roster
+from tutorial.content import render_section
+
+
+def encouragement():
+    st.success(f"**You've got this, {roster.first_name()}! Trust your preparation and do your best!**")
+
+
+def render():
+    render_section("exam_day_tips", widgets={"encouragement": encouragement})
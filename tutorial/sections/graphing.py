@@ -0,0 +1,6 @@
+"""Method 1: Graphing."""
+from tutorial.content import render_section
+
+
+def render():
+    render_section("graphing")
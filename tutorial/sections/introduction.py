@@ -0,0 +1,6 @@
+"""Introduction to Systems."""
+from tutorial.content import render_section
+
+
+def render():
+    render_section("introduction")
@@ -0,0 +1,63 @@
+"""Practice Problems."""
+import streamlit as st
+
+from tutorial import events, generator, pool
+from tutorial.content import render_section
+from tutorial.store import save_session, session_progress
+from tutorial.traces import METHODS, render_trace, trace
+
+# Difficulty choice -> content part holding that level's problems.
+LEVELS = {
+    "Level 1: Basic": "level_1_basic",
+    "Level 2: Intermediate": "level_2_intermediate",
+    "Level 3: Advanced": "level_3_advanced",
+    "Level 4: Challenge": "level_4_challenge",
+}
+
+
+def render():
+    render_section("practice_problems", widgets={"problem_set": problem_set, "own_system": own_system})
+
+
+@st.fragment
+def problem_set():
+    """Problems for the chosen level; revealing a solution reruns only this block."""
+    difficulty_level = st.selectbox("Choose difficulty:", list(LEVELS))
+    render_section("practice_problems", LEVELS[difficulty_level])
+    random_problem(list(LEVELS).index(difficulty_level) + 1)
+
+
+def random_problem(level):
+    """A problem of ``level`` drawn from the prebuilt pool, with its worked solution."""
+    st.markdown("---")
+    if st.button(f"🎲 New Level {level} problem", key=f"new_problem_{level}"):
+        seen = session_progress().seen
+        st.session_state[f"pool_index_{level}"] = pool.draw(pool.load_pool(), level, seen=seen)
+        save_session()
+    index = st.session_state.get(f"pool_index_{level}")
+    if index is None:
+        return
+    problem_pool = pool.load_pool()
+    problems = problem_pool.problems
+    equations = generator.problem_equations(problems, index)
+    statement = generator.word_statement(problems, index)
+    if statement:
+        st.markdown(f"**Random problem:** {statement}".replace("$", "\\$"))
+    else:
+        st.markdown("**Random problem:** Solve the system")
+        st.code("\n".join(equations))
+    key = f"problem_solution_{level}_{index}"
+    if st.checkbox("Show solution", key=key, on_change=events.solution_toggled, args=(key,)):
+        render_trace(trace(equations, pool.problem_method(problem_pool, index)))
+
+
+@st.fragment
+def own_system():
+    """Step-by-step trace of a system the student types in."""
+    text = st.text_area("Your system:", "2x + 3y = 7\n3x + 2y = 8", key="own_system")
+    method = st.radio("Method:", [method.title() for method in METHODS], horizontal=True, key="own_method")
+    equations = [line for line in text.splitlines() if line.strip()]
+    try:
+        render_trace(trace(equations, method.lower()))
+    except ValueError as error:
+        st.warning(f"Couldn't solve that system: {error}")
@@ -0,0 +1,175 @@
+"""Practice Test."""
+from array import array
+
+import streamlit as st
+
+from tutorial import adaptive, events, questions
+from tutorial.store import save_session, session_progress
+
+TEST_LENGTHS = (5, 10, 15, 20, 30)
+
+
+def grade_test(test_ids, answers):
+    """Score a submitted test, logging each answer; ``answers`` maps question ids to responses."""
+    correct = questions.grade(questions.load_bank(), test_ids, answers)
+    for question_id, right in zip(test_ids, correct):
+        events.answered(question_id, answers.get(question_id), right)
+    return int(correct.sum())
+
+
+def current_test():
+    """Question ids of the test this student is taking; the standard test until a new one is drawn."""
+    bank = questions.load_bank()
+    progress = session_progress()
+    # Positions saved against another bank (a new pool or question set) point
+    # at other questions; drop that test.
+    if progress.test and progress.test_bank != bank.fingerprint:
+        progress.test = array("H")
+    if not progress.test:
+        return tuple(question.id for question in questions.PRACTICE_TEST)
+    return tuple(bank.questions[position].id for position in progress.test)
+
+
+def question_widget(number, question, prefix="test"):
+    """Prompt and input for one question; the value lands in ``<prefix>_<id>``."""
+    key = f"{prefix}_{question.id}"
+    prompt = f"**{number}. {question.prompt}**"
+    if question.label is not None:
+        st.markdown(prompt)
+    label = prompt if question.label is None else question.label
+    if question.kind in ("choice", "classification"):
+        st.radio(label, question.options, key=key)
+    elif question.kind == "number":
+        low, high = question.limits
+        st.number_input(label, min_value=low, max_value=high, step=1, key=key)
+    else:
+        st.text_input(label, key=key)
+
+
+def render():
+    st.header("Practice Test: Systems of Equations")
+    st.markdown("Test your knowledge! Answer all questions to see your score.")
+
+    mode = st.radio("Mode:", ["Full test", "Adaptive practice"], horizontal=True, key="test_mode")
+    if mode == "Adaptive practice":
+        adaptive_practice()
+        return
+
+    if 'test_submitted' not in st.session_state:
+        st.session_state.test_submitted = False
+
+    bank = questions.load_bank()
+    length_column, draw_column = st.columns([1, 2])
+    length = length_column.selectbox("Questions:", TEST_LENGTHS, index=1, key="test_length")
+    if draw_column.button("🎲 Draw a new test"):
+        drawn = questions.draw_test(bank, length)
+        progress = session_progress()
+        progress.test = array("H", (bank.index[question_id] for question_id in drawn))
+        progress.test_bank = bank.fingerprint
+        st.session_state.test_submitted = False
+        save_session()
+    test_ids = current_test()
+    total_questions = len(test_ids)
+
+    # Answers stay in the browser until "Submit Test"; grading runs once per submission.
+    with st.form("practice_test"):
+        section = None
+        for number, question_id in enumerate(test_ids, 1):
+            question = bank.questions[bank.index[question_id]]
+            if question.section != section:
+                if section is not None:
+                    st.markdown("---")
+                section = question.section
+                st.subheader(section)
+            question_widget(number, question)
+
+        submitted = st.form_submit_button("Submit Test", type="primary")
+
+    if submitted:
+        answers = {question_id: st.session_state[f"test_{question_id}"] for question_id in test_ids}
+        st.session_state.test_submitted = True
+        session_progress().record_test(grade_test(test_ids, answers), total_questions)
+        save_session()
+
+    if st.session_state.test_submitted:
+        progress = session_progress()
+        percentage = (progress.test_score / progress.test_total) * 100
+        st.markdown("---")
+        st.subheader("Test Results")
+        st.metric("Your Score", f"{progress.test_score}/{progress.test_total}")
+        st.metric("Percentage", f"{percentage:.1f}%")
+        earlier = progress.history()[:-1]
+        if earlier:
+            st.caption("Earlier scores: " + ", ".join(f"{score}/{total}" for score, total in earlier))
+
+        if percentage >= 90:
+            st.success("🌟 Excellent! You're ready for the exam!")
+            if submitted:
+                st.balloons()
+        elif percentage >= 70:
+            st.info("👍 Good work! Review the sections where you missed questions.")
+        else:
+            st.warning("📚 Keep studying! Go back through the tutorial sections.")
+
+        if st.button("Retake Test"):
+            st.session_state.test_submitted = False
+            st.rerun()
+
+
+def _answer_text(question):
+    answer = question.answer
+    if isinstance(answer, tuple):
+        return "(" + ", ".join(str(value) for value in answer) + ")"
+    return str(answer)
+
+
+def _submit_adaptive(question):
+    """Grade the adaptive question just answered and move the student's estimate."""
+    state, progress = st.session_state.adaptive, session_progress()
+    response = st.session_state[f"adaptive_{question.id}"]
+    correct = bool(questions.grade(questions.load_bank(), [question.id], {question.id: response})[0])
+    events.answered(question.id, response, correct)
+    progress.record_adaptive(
+        adaptive.update(progress.ability, progress.adaptive_answered, correct, question.difficulty), correct)
+    save_session()
+    state["answered"].append(state["current"])
+    state["current"] = None
+    state["feedback"] = "✓ Correct!" if correct else f"Not quite - the answer was {_answer_text(question)}."
+
+
+def _restart_adaptive():
+    session_progress().reset_adaptive()
+    save_session()
+    del st.session_state["adaptive"]
+
+
+@st.fragment
+def adaptive_practice():
+    """One question at a time, each chosen for the student's current ability estimate.
+
+    The estimate and counts are saved with the student's progress; which
+    questions this session has asked is not, so a refresh may ask one again.
+    """
+    bank, table, progress = questions.load_bank(), adaptive.load_table(), session_progress()
+    state = st.session_state.setdefault("adaptive", {"answered": [], "current": None})
+    st.markdown(f"Each question is picked to match your level. Answer {adaptive.ADAPTIVE_LENGTH} to see your estimate.")
+    if state.get("feedback"):
+        st.caption(f"Previous question: {state['feedback']}")
+
+    done = progress.adaptive_answered >= adaptive.ADAPTIVE_LENGTH
+    if not done and state["current"] is None:
+        state["current"] = adaptive.next_item(table, progress.ability, set(state["answered"]))
+        done = state["current"] is None
+    if done:
+        st.metric("Correct", f"{progress.adaptive_correct}/{progress.adaptive_answered}")
+        st.metric("Ability estimate", f"{progress.ability:+.1f}")
+        st.info(adaptive.ability_label(progress.ability))
+        st.button("Start over", key="adaptive_restart", on_click=_restart_adaptive)
+        return
+
+    question = bank.questions[state["current"]]
+    st.progress(progress.adaptive_answered / adaptive.ADAPTIVE_LENGTH,
+                text=f"Question {progress.adaptive_answered + 1} of {adaptive.ADAPTIVE_LENGTH}")
+    with st.form(f"adaptive_{question.id}"):
+        question_widget(progress.adaptive_answered + 1, question, prefix="adaptive")
+        st.form_submit_button("Submit Answer", type="primary", on_click=_submit_adaptive, args=(question,))
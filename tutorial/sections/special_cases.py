@@ -0,0 +1,6 @@
+"""Special Cases."""
+from tutorial.content import render_section
+
+
+def render():
+    render_section("special_cases")
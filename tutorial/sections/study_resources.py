@@ -0,0 +1,20 @@
+"""Study Resources."""
+import streamlit as st
+
+from tutorial.content import render_section
+
+# Math level choice -> content part listing that level's IXL lessons.
+IXL_LEVELS = {
+    "Algebra 1": "algebra_1",
+    "Algebra 2": "algebra_2",
+    "Pre-Calculus": "pre_calculus",
+}
+
+
+def ixl_lessons():
+    grade_select = st.selectbox("Select your math level:", list(IXL_LEVELS))
+    render_section("study_resources", IXL_LEVELS[grade_select])
+
+
+def render():
+    render_section("study_resources", widgets={"ixl_lessons": ixl_lessons})
@@ -0,0 +1,6 @@
+"""Method 2: Substitution."""
+from tutorial.content import render_section
+
+
+def render():
+    render_section("substitution")
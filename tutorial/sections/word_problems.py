@@ -0,0 +1,40 @@
+"""Word Problems."""
+import random
+
+import streamlit as st
+
+from tutorial import events, stories
+from tutorial.content import render_section
+from tutorial.traces import render_trace
+
+# Stories sampled per template and process; a student draws one by index.
+STORY_BATCH = 4096
+
+
+def render():
+    render_section("word_problems", widgets={"fresh_story": fresh_story})
+
+
+@st.cache_resource(show_spinner=False)
+def story_batch(name):
+    """A batch of sampled parameters for template ``name``, shared by every session."""
+    return stories.sample(name, STORY_BATCH)
+
+
+@st.fragment
+def fresh_story():
+    """A freshly sampled word problem with its worked solution."""
+    name = st.radio("Story type:", list(stories.TEMPLATES), horizontal=True, key="story_type",
+                    format_func=lambda name: stories.TEMPLATES[name].title)
+    if st.button("🎲 New word problem", key="new_story") or f"story_{name}" not in st.session_state:
+        st.session_state[f"story_{name}"] = random.randrange(STORY_BATCH)
+    index = st.session_state[f"story_{name}"]
+    story = stories.story(name, story_batch(name), index)
+    # Escaped so Markdown doesn't read "$8 ... $5" as math.
+    st.markdown(f"**Problem:**\n{story.text}".replace("$", "\\$"))
+    key = f"story_solution_{name}_{index}"
+    if st.checkbox("Show solution", key=key, on_change=events.solution_toggled, args=(key,)):
+        st.markdown("**Define variables**\n" + "\n".join(f"- {line}" for line in story.variables))
+        st.markdown("**Write equations**\n```\n" + "\n".join(story.equations) + "\n```")
+        render_trace(story.trace)
+        st.success(f"**Answer: {story.answer}**".replace("$", "\\$"))
@@ -0,0 +1,215 @@
+"""Exact solver for linear systems with integer or rational coefficients.
+
+``solve`` handles one system of any size: rows are ``(a1, ..., an, c)`` for
+``a1*v1 + ... + an*vn = c`` (the shape ``tutorial.equations`` produces).
+Rows are scaled to integers and reduced with fraction-free (Bareiss)
+elimination, so intermediate values stay integers and the result is exact.
+
+``solve_batch`` solves many same-size systems at once from NumPy integer
+arrays; 2x2 and 3x3 systems use vectorized integer determinants (Cramer's
+rule plus minor-based rank tests), larger ones fall back to ``solve``.
+"""
+import math
+from collections import namedtuple
+from fractions import Fraction
+from itertools import combinations
+
+from tutorial.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+UNIQUE, NO_SOLUTION, INFINITE = 0, 1, 2
+KIND_NAMES = {UNIQUE: "unique", NO_SOLUTION: "none", INFINITE: "infinite"}
+
+# kind: UNIQUE / NO_SOLUTION / INFINITE.
+# values: the solution for UNIQUE; for INFINITE the particular solution with
+#   every free variable set to 0; None for NO_SOLUTION.
+# free: indices of the free variables (INFINITE only).
+# directions: one direction vector per free variable, so every solution is
+#   values + sum(t_i * directions[i]).
+Solution = namedtuple("Solution", ["kind", "values", "free", "directions"])
+
+
+def integer_rows(rows):
+    """Scale each rational row by the lcm of its denominators."""
+    scaled = []
+    for row in rows:
+        if all(isinstance(value, int) for value in row):
+            scaled.append(list(row))
+            continue
+        row = [Fraction(value) for value in row]
+        lcm = math.lcm(*(value.denominator for value in row))
+        scaled.append([int(value * lcm) for value in row])
+    return scaled
+
+
+def echelon(rows):
+    """Fraction-free row echelon form of integer ``rows`` and its pivot columns."""
+    m = [list(row) for row in rows]
+    n_rows, n_cols = len(m), len(m[0]) - 1
+    pivots = []
+    prev = 1
+    r = 0
+    for col in range(n_cols):
+        pivot = next((i for i in range(r, n_rows) if m[i][col]), None)
+        if pivot is None:
+            continue
+        m[r], m[pivot] = m[pivot], m[r]
+        for i in range(r + 1, n_rows):
+            for j in range(col + 1, n_cols + 1):
+                # Bareiss step: the division by the previous pivot is exact.
+                m[i][j] = (m[r][col] * m[i][j] - m[i][col] * m[r][j]) // prev
+            m[i][col] = 0
+        prev = m[r][col]
+        pivots.append(col)
+        r += 1
+        if r == n_rows:
+            break
+    return m, pivots
+
+
+def solve(rows):
+    """Solve one system exactly; returns a ``Solution``."""
+    m, pivots = echelon(integer_rows(rows))
+    n_vars = len(m[0]) - 1
+    rank = len(pivots)
+    if any(row[-1] for row in m[rank:]):
+        return Solution(NO_SOLUTION, None, (), ())
+
+    def back_substitute(rhs, free_values):
+        values = [Fraction(0)] * n_vars
+        for var, value in free_values.items():
+            values[var] = Fraction(value)
+        for r in reversed(range(rank)):
+            col = pivots[r]
+            total = rhs(r) - sum(m[r][j] * values[j] for j in range(col + 1, n_vars))
+            values[col] = Fraction(total) / m[r][col]
+        return tuple(values)
+
+    free = tuple(col for col in range(n_vars) if col not in pivots)
+    values = back_substitute(lambda r: m[r][-1], {})
+    if not free:
+        return Solution(UNIQUE, values, (), ())
+    directions = tuple(back_substitute(lambda r: 0, {var: 1}) for var in free)
+    return Solution(INFINITE, values, free, directions)
+
+
+def _term(coef, name):
+    if coef == 1:
+        return name
+    if coef == -1:
+        return f"-{name}"
+    return f"({coef}){name}" if coef.denominator != 1 else f"{coef}{name}"
+
+
+def describe(solution, variables="xy"):
+    """Readable form of a solution, e.g. ``(2, 3)`` or ``x = (1/3)y - 2/3, y any``."""
+    if solution.kind == NO_SOLUTION:
+        return "no solution"
+    if solution.kind == UNIQUE:
+        return "(" + ", ".join(str(value) for value in solution.values) + ")"
+    parts = []
+    for var, value in enumerate(solution.values):
+        if var in solution.free:
+            continue
+        expr = " + ".join(
+            _term(direction[var], variables[free])
+            for free, direction in zip(solution.free, solution.directions) if direction[var]
+        )
+        if value or not expr:
+            expr = f"{expr} + {value}" if expr else str(value)
+        parts.append(f"{variables[var]} = {expr}".replace("+ -", "- "))
+    parts += [f"{variables[free]} any" for free in solution.free]
+    return ", ".join(parts)
+
+
+def _det2(a, b, c, d):
+    return a * d - b * c
+
+
+def _det3(m):
+    return (m[..., 0, 0] * _det2(m[..., 1, 1], m[..., 1, 2], m[..., 2, 1], m[..., 2, 2])
+            - m[..., 0, 1] * _det2(m[..., 1, 0], m[..., 1, 2], m[..., 2, 0], m[..., 2, 2])
+            + m[..., 0, 2] * _det2(m[..., 1, 0], m[..., 1, 1], m[..., 2, 0], m[..., 2, 1]))
+
+
+def _minors_nonzero(aug, size, cols):
+    """Whether any ``size``x``size`` minor of ``aug[..., :, cols]`` is nonzero."""
+    n_rows = aug.shape[-2]
+    found = np.zeros(aug.shape[0], dtype=bool)
+    for rows in combinations(range(n_rows), size):
+        for picked in combinations(cols, size):
+            sub = aug[:, rows][:, :, picked]
+            if size == 1:
+                det = sub[:, 0, 0]
+            elif size == 2:
+                det = _det2(sub[:, 0, 0], sub[:, 0, 1], sub[:, 1, 0], sub[:, 1, 1])
+            else:
+                det = _det3(sub)
+            found |= det != 0
+    return found
+
+
+def _rank(aug, cols):
+    rank = np.zeros(aug.shape[0], dtype=np.int8)
+    for size in range(1, len(cols) + 1):
+        if size > aug.shape[-2]:
+            break
+        rank[_minors_nonzero(aug, size, cols)] = size
+    return rank
+
+
+def solve_batch(A, b):
+    """Solve ``N`` square systems ``A[k] @ v = b[k]`` exactly.
+
+    ``A`` is an integer array of shape ``(N, n, n)`` and ``b`` ``(N, n)``.
+    Returns ``(kind, num, den)``: ``kind`` is ``(N,)`` with UNIQUE /
+    NO_SOLUTION / INFINITE, and for unique systems the solution is
+    ``num[k] / den[k]`` in lowest terms (``num`` is ``(N, n)``, ``den`` is
+    ``(N,)``; both are 0 for other kinds).  Coefficients must be small
+    enough for the 3x3 determinants to fit in int64 (|a| < 10**5).
+    """
+    A = np.asarray(A, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    count, n = A.shape[0], A.shape[-1]
+    if n not in (2, 3):
+        return _solve_batch_exact(A, b)
+
+    det = _det3(A) if n == 3 else _det2(A[:, 0, 0], A[:, 0, 1], A[:, 1, 0], A[:, 1, 1])
+    num = np.empty((count, n), dtype=np.int64)
+    for col in range(n):
+        replaced = A.copy()
+        replaced[:, :, col] = b
+        num[:, col] = (_det3(replaced) if n == 3 else
+                       _det2(replaced[:, 0, 0], replaced[:, 0, 1], replaced[:, 1, 0], replaced[:, 1, 1]))
+
+    den = det.copy()
+    unique = det != 0
+    common = np.gcd.reduce(np.column_stack([num, den]), axis=1)
+    common[common == 0] = 1
+    sign = np.where(den < 0, -1, 1)
+    num = np.where(unique[:, None], num * sign[:, None] // common[:, None], 0)
+    den = np.where(unique, den * sign // common, 0)
+
+    kind = np.full(count, UNIQUE, dtype=np.int8)
+    singular = np.flatnonzero(~unique)
+    if singular.size:
+        aug = np.concatenate([A[singular], b[singular, :, None]], axis=2)
+        rank_a = _rank(aug, tuple(range(n)))
+        rank_aug = _rank(aug, tuple(range(n + 1)))
+        kind[singular] = np.where(rank_aug > rank_a, NO_SOLUTION, INFINITE)
+    return kind, num, den
+
+
+def _solve_batch_exact(A, b):
+    count, n = A.shape[0], A.shape[-1]
+    kind = np.empty(count, dtype=np.int8)
+    num = np.zeros((count, n), dtype=np.int64)
+    den = np.zeros(count, dtype=np.int64)
+    for k in range(count):
+        solution = solve([list(map(int, row)) + [int(c)] for row, c in zip(A[k], b[k])])
+        kind[k] = solution.kind
+        if solution.kind == UNIQUE:
+            den[k] = math.lcm(*(value.denominator for value in solution.values))
+            num[k] = [int(value * den[k]) for value in solution.values]
+    return kind, num, den
@@ -0,0 +1,155 @@
+"""Student progress saved to SQLite so it survives refreshes and restarts.
+
+A session loads its student's progress once, on its first run, and from
+then on only writes.  ``save`` never touches the disk: it records the
+latest state for the student and returns.  One background thread per
+process wakes every ``FLUSH_INTERVAL`` seconds and writes everything
+pending in a single transaction, keeping only the newest state per
+student, so hundreds of sessions clicking at once cost one short write.
+
+The database runs in WAL mode, so readers never wait for the writer and
+the writer never waits for readers.  Every thread reads through its own
+connection (SQLite connections must not be shared across threads), and the
+writer thread is the only one that writes, so sessions never contend for
+the write lock.  A write that fails (a locked database, a full disk) is
+logged and its states stay queued for the next flush; whatever is pending
+is flushed at interpreter exit.  What is stored is a student's
+``Progress`` (``tutorial.progress``) as bytes.
+
+The student is chosen by the ``?student=`` query parameter.  Set
+``TUTORIAL_DB`` to put the database somewhere other than ``data/``.
+"""
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import streamlit as st
+
+from tutorial.flusher import Flusher
+from tutorial.progress import Progress
+
+DB_PATH = Path(os.environ.get("TUTORIAL_DB", Path(__file__).resolve().parent.parent / "data" / "progress.db"))
+FLUSH_INTERVAL = 0.25
+DEFAULT_STUDENT = "guest"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    student TEXT PRIMARY KEY,
+    state BLOB NOT NULL,
+    updated REAL NOT NULL
+)
+"""
+
+
+class ProgressStore:
+    """Per-student progress in SQLite with batched background writes."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._pending = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+        self._writer = Flusher(self.flush, FLUSH_INTERVAL, "progress-writer")
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _connection(self):
+        """This thread's connection, opened on first use."""
+        if getattr(self._local, "connection", None) is None:
+            self._local.connection = self._connect()
+        return self._local.connection
+
+    def load(self, student):
+        """The student's saved state as bytes, or None; pending and in-flight writes count."""
+        with self._lock:
+            for queued in (self._pending, self._inflight):
+                if student in queued:
+                    return queued[student]
+        row = self._connection().execute("SELECT state FROM progress WHERE student = ?", (student,)).fetchone()
+        return bytes(row[0]) if row else None
+
+    def save(self, student, state):
+        """Queue ``state`` (bytes) for the student; returns at once."""
+        with self._lock:
+            self._pending[student] = state
+
+    def flush(self):
+        """Write every pending state in one transaction; returns how many were written.
+
+        The batch stays readable by ``load`` until it is committed, so a
+        session loading meanwhile never sees the older row.  If the write
+        fails, states not replaced by newer saves meanwhile go back in the
+        queue and the error is raised.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._inflight = batch
+            if not batch:
+                return 0
+            now = time.time()
+            try:
+                with self._connection() as connection:
+                    connection.executemany(
+                        "INSERT INTO progress (student, state, updated) VALUES (?, ?, ?) "
+                        "ON CONFLICT(student) DO UPDATE SET state = excluded.state, updated = excluded.updated",
+                        [(student, blob, now) for student, blob in batch.items()])
+            except Exception:
+                with self._lock:
+                    for student, blob in batch.items():
+                        self._pending.setdefault(student, blob)
+                    self._inflight = {}
+                raise
+            with self._lock:
+                self._inflight = {}
+            return len(batch)
+
+    def close(self):
+        """Stop the writer after a last flush."""
+        self._writer.close()
+
+
+@st.cache_resource(show_spinner=False)
+def get_store():
+    """The process-wide store, shared by every session."""
+    return ProgressStore()
+
+
+def student_id():
+    return st.query_params.get("student") or DEFAULT_STUDENT
+
+
+def session_student():
+    """The student this session loaded; cheaper than ``student_id`` on hot paths."""
+    return st.session_state.get("progress_student", DEFAULT_STUDENT)
+
+
+def load_session():
+    """Restore the student's saved ``Progress`` into this session, once per session."""
+    if st.session_state.get("progress_student") == student_id():
+        return
+    st.session_state.progress_student = student_id()
+    saved = get_store().load(student_id())
+    st.session_state.progress = Progress.from_bytes(saved) if saved else Progress()
+
+
+def session_progress():
+    """This session's ``Progress``, loading it first if need be."""
+    load_session()
+    return st.session_state.progress
+
+
+def save_session():
+    """Queue this session's progress to be written in the background."""
+    get_store().save(student_id(), st.session_state.progress.to_bytes())
@@ -0,0 +1,187 @@
+"""Word-problem templates: tickets, livestock, mixtures, rates and interest.
+
+Each ``Template`` declares its story once: the variables and what they
+count, how to sample parameters (the answer is drawn first and the totals
+computed from it, so every answer is a whole number), the equation
+skeleton as integer rows, the prose and the answer sentence.  ``sample``
+draws a whole batch of parameters with NumPy; ``story`` turns one entry of
+a batch into a ``Story`` with its prose, system, answer and solution trace.
+
+Words that change between variants of a story (a theater or a museum,
+chickens or ducks) live in the template's ``variants``; each sample picks
+one by index.
+"""
+from collections import namedtuple
+
+from tutorial.equations import format_equation
+from tutorial.lazy import lazy_import
+from tutorial.traces import trace_rows
+
+np = lazy_import("numpy")
+
+# name: key; title: shown in the UI; variables: (letter, meaning) pairs,
+# both formatted with the sample's words; sample(rng, count): dict of integer
+# parameter arrays, answers included; rows(params): two (a, b, c) rows for
+# ``a*v1 + b*v2 = c`` from the parameters; text and answer: format strings
+# over the parameters and words; variants: word dicts; method: for the trace.
+Template = namedtuple("Template", ["name", "title", "variables", "sample", "rows", "text", "answer", "variants",
+                                   "method"])
+# text: the story; variables: "Let ..." lines; equations: the system;
+# answer: the answer sentence; trace: a traces.Trace of the solution.
+Story = namedtuple("Story", ["text", "variables", "equations", "answer", "trace"])
+
+
+def _between(rng, low, high, count):
+    """Integers in ``[low, high]``."""
+    return rng.integers(low, high + 1, count)
+
+
+# --- Samplers ---
+
+def _tickets(rng, count):
+    adult_price = _between(rng, 6, 15, count)
+    child_price = adult_price - _between(rng, 1, 5, count)
+    adults, children = _between(rng, 5, 60, (2, count))
+    return {"adult_price": adult_price, "child_price": child_price, "adults": adults, "children": children,
+            "tickets": adults + children, "money": adult_price * adults + child_price * children}
+
+
+def _livestock(rng, count):
+    birds, beasts = _between(rng, 3, 40, (2, count))
+    return {"birds": birds, "beasts": beasts, "animals": birds + beasts, "legs": 2 * birds + 4 * beasts}
+
+
+MIXTURE_STRENGTHS = (10, 15, 20, 25, 30, 40, 50, 60, 75, 80)
+
+
+def _mixture(rng, count):
+    # Strengths are multiples of 5 and volumes split in tenths of the total,
+    # so the target strength is a whole or half percent.
+    low = rng.integers(0, len(MIXTURE_STRENGTHS) - 1, count)
+    high = low + 1 + (rng.random(count) * (len(MIXTURE_STRENGTHS) - 1 - low)).astype(np.int64)
+    unit = _between(rng, 1, 6, count)
+    tenths = _between(rng, 1, 9, count)
+    weak, strong = unit * tenths, unit * (10 - tenths)
+    strengths = np.array(MIXTURE_STRENGTHS)
+    weak_strength, strong_strength = strengths[low], strengths[high]
+    return {"weak_strength": weak_strength, "strong_strength": strong_strength, "weak": weak, "strong": strong,
+            "volume": 10 * unit, "pure": weak_strength * weak + strong_strength * strong}
+
+
+def _rates(rng, count):
+    current = _between(rng, 1, 8, count)
+    speed = current + _between(rng, 2, 20, count)
+    with_time, against_time = _between(rng, 2, 5, (2, count))
+    return {"speed": speed, "current": current, "with_time": with_time, "against_time": against_time,
+            "with_distance": (speed + current) * with_time, "against_distance": (speed - current) * against_time}
+
+
+def _interest(rng, count):
+    low_rate = _between(rng, 2, 6, count)
+    high_rate = low_rate + _between(rng, 1, 4, count)
+    # Amounts in hundreds keep the interest in whole dollars.
+    low, high = 100 * _between(rng, 5, 100, (2, count))
+    return {"low_rate": low_rate, "high_rate": high_rate, "low": low, "high": high, "total": low + high,
+            "interest": (low_rate * low + high_rate * high) // 100}
+
+
+TEMPLATES = {
+    template.name: template for template in (
+        Template(
+            "tickets", "🎟️ Tickets",
+            (("a", "number of adult tickets"), ("c", "number of child tickets")),
+            _tickets,
+            lambda p: ((1, 1, p["tickets"]), (p["adult_price"], p["child_price"], p["money"])),
+            "{place} sells adult tickets for ${adult_price} and child tickets for ${child_price}. One day they "
+            "sold {tickets} tickets and made ${money}. How many of each ticket did they sell?",
+            "{adults} adult tickets and {children} child tickets",
+            ({"place": "A store"}, {"place": "A movie theater"}, {"place": "The school play"},
+             {"place": "A museum"}),
+            "substitution",
+        ),
+        Template(
+            "livestock", "🐄 Livestock",
+            (("{b}", "number of {bird}"), ("{m}", "number of {beast}")),
+            _livestock,
+            lambda p: ((1, 1, p["animals"]), (2, 4, p["legs"])),
+            "A farmer has {bird} and {beast}. There are {animals} animals total and {legs} legs total. "
+            "How many {bird} and how many {beast} are there?\n\n"
+            "(Remember: {bird} have 2 legs, {beast} have 4 legs)",
+            "{birds} {bird} and {beasts} {beast}",
+            ({"bird": "chickens", "beast": "cows", "b": "c", "m": "w"},
+             {"bird": "ducks", "beast": "goats", "b": "d", "m": "g"},
+             {"bird": "turkeys", "beast": "pigs", "b": "t", "m": "p"}),
+            "substitution",
+        ),
+        Template(
+            "mixture", "🧪 Mixtures",
+            (("x", "{unit} of {weak_strength}% {liquid}"), ("y", "{unit} of {strong_strength}% {liquid}")),
+            _mixture,
+            lambda p: ((1, 1, p["volume"]), (p["weak_strength"], p["strong_strength"], p["pure"])),
+            "A {maker} needs to mix a {weak_strength}% {liquid} with a {strong_strength}% {liquid} to make "
+            "{volume} {unit} of a {target:g}% {liquid}. How many {unit} of each should be used?",
+            "{weak} {unit} of {weak_strength}% {liquid} and {strong} {unit} of {strong_strength}% {liquid}",
+            ({"maker": "chemist", "liquid": "acid solution", "unit": "liters"},
+             {"maker": "nurse", "liquid": "saline solution", "unit": "milliliters"},
+             {"maker": "gardener", "liquid": "fertilizer mix", "unit": "gallons"}),
+            "elimination",
+        ),
+        Template(
+            "rates", "🚤 Rates",
+            (("{s}", "speed of the {mover} in still {medium} (mph)"), ("{f}", "speed of the {flow} (mph)")),
+            _rates,
+            lambda p: ((p["with_time"], p["with_time"], p["with_distance"]),
+                       (p["against_time"], -p["against_time"], p["against_distance"])),
+            "A {mover} travels {with_distance} miles {along} in {with_time} hours and {against_distance} miles "
+            "{against} in {against_time} hours. Find the speed of the {mover} in still {medium} and the speed of "
+            "the {flow}.",
+            "The {mover} goes {speed} mph and the {flow} is {current} mph",
+            ({"mover": "boat", "flow": "current", "along": "downstream", "against": "upstream", "medium": "water",
+              "s": "b", "f": "c"},
+             {"mover": "plane", "flow": "wind", "along": "with the wind", "against": "against the wind",
+              "medium": "air", "s": "p", "f": "w"}),
+            "elimination",
+        ),
+        Template(
+            "interest", "💰 Interest",
+            (("x", "dollars invested at {low_rate}%"), ("y", "dollars invested at {high_rate}%")),
+            _interest,
+            lambda p: ((1, 1, p["total"]), (p["low_rate"], p["high_rate"], 100 * p["interest"])),
+            "{person} invested ${total:,} in two accounts, one paying {low_rate}% simple interest a year and the "
+            "other {high_rate}%. After one year the accounts earned ${interest:,} in interest. How much was "
+            "invested in each account?",
+            "${low:,} at {low_rate}% and ${high:,} at {high_rate}%",
+            ({"person": "Maria"}, {"person": "Juan"}, {"person": "A credit union member"}),
+            "substitution",
+        ),
+    )
+}
+
+
+def sample(name, count, rng=None):
+    """Parameters for ``count`` stories of template ``name``, plus a ``variant`` index."""
+    rng = np.random.default_rng() if rng is None else rng
+    template = TEMPLATES[name]
+    params = template.sample(rng, count)
+    params["variant"] = rng.integers(len(template.variants), size=count)
+    return params
+
+
+def _values(params, index):
+    values = {key: value[index].item() for key, value in params.items()}
+    if "pure" in values:
+        values["target"] = values["pure"] / values["volume"]
+    return values
+
+
+def story(name, params, index):
+    """Story ``index`` of a sampled batch, with its system and solution trace."""
+    template = TEMPLATES[name]
+    values = _values(params, index)
+    words = {**values, **template.variants[values["variant"]]}
+    letters = "".join(letter.format(**words) for letter, _ in template.variables)
+    variables = tuple(f"Let {letter.format(**words)} = {meaning.format(**words)}"
+                      for letter, meaning in template.variables)
+    rows = template.rows(values)
+    return Story(template.text.format(**words), variables, [format_equation(row, letters) for row in rows],
+                 template.answer.format(**words), trace_rows(rows, letters, template.method))
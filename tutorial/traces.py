@@ -0,0 +1,394 @@
+"""Step-by-step solution traces for substitution, elimination and graphing.
+
+``trace(equations, method)`` works through any square system the tutorial
+can parse and returns a ``Trace`` of ``Step`` records: isolate a variable,
+substitute, scale and add equations, back-substitute, check.  Elimination
+handles any number of variables; substitution and graphing need two.
+``trace_blocks`` lays a trace out like the hand-written examples as content
+blocks, and ``render_trace`` draws it with ``tutorial.content``.
+
+The trace shows the system as it was given.  Equations with fractions or
+a common factor are first rescaled to coprime integers (``canonical_rows``)
+in a step of their own, and the method works with those; the final check
+uses the equations as given.  Traces are memoized per process on the
+system and which variable each equation was written solved for, so all
+sessions share them and a repeated problem is only traced once.
+"""
+import math
+from collections import namedtuple
+from fractions import Fraction
+from functools import lru_cache
+
+from tutorial import solver
+from tutorial.content import render_blocks
+from tutorial.equations import format_equation, format_solved, format_terms, isolated_variable, parse_system
+
+METHODS = ("substitution", "elimination", "graphing")
+# Recently shown systems; a trace takes about 3.5 KB, so about 7 MB per
+# process.  A story missing the cache is traced again in under half a
+# millisecond, not worth keeping every sampled story.
+TRACE_CACHE_SIZE = 2048
+ORDINALS = ("first", "second", "third")
+INTRODUCTIONS = {
+    "substitution": "Solve using substitution:",
+    "elimination": "Solve using elimination:",
+    "graphing": "Solve by graphing:",
+}
+
+# title: text after "Step N:"; work: lines for a code block; bullets: list
+# items under it; plot: equations to graph after the step.
+Step = namedtuple("Step", ["title", "work", "bullets", "plot"], defaults=((), (), None))
+# equations: the system as traced; kind and solution follow tutorial.solver.
+Trace = namedtuple("Trace", ["method", "variables", "equations", "steps", "kind", "solution"])
+
+
+def canonical_rows(rows):
+    """Rows scaled to coprime integers, signs kept: the memo key for traces."""
+    canonical = []
+    for row in solver.integer_rows(rows):
+        divisor = math.gcd(*row) or 1
+        canonical.append(tuple(value // divisor for value in row))
+    return tuple(canonical)
+
+
+def trace(equations, method="substitution"):
+    """Trace solving ``equations`` (one equation string each) by ``method``."""
+    variables, rows = parse_system(equations)
+    isolated = tuple(isolated_variable(line) or "" for line in equations)
+    return trace_rows(rows, variables, method, isolated)
+
+
+def trace_rows(rows, variables="xy", method="substitution", isolated=None):
+    """Trace already-parsed ``(a1, ..., an, c)`` rows.
+
+    ``isolated`` names, per row, the variable the equation is written
+    solved for (``""`` for none); it only changes how steps are worded.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}")
+    if len(rows) != len(variables):
+        raise ValueError("A trace needs as many equations as variables")
+    if method != "elimination" and len(variables) != 2:
+        raise ValueError(f"{method.title()} traces need two equations in two variables")
+    isolated = tuple(isolated or ("",) * len(rows))
+    return _trace(method, variables, tuple(tuple(Fraction(value) for value in row) for row in rows), isolated)
+
+
+@lru_cache(maxsize=TRACE_CACHE_SIZE)
+def _trace(method, variables, given, isolated):
+    rows = [tuple(Fraction(value) for value in row) for row in canonical_rows(given)]
+    equations = tuple(_display(row, variables, var) for row, var in zip(given, isolated))
+    steps = _scale_steps(given, rows, variables, isolated)
+    method_steps, kind, solution = _TRACERS[method](rows, variables, isolated)
+    steps += method_steps
+    if kind == solver.UNIQUE:
+        steps.append(_check_step(given, variables, solution, isolated))
+    return Trace(method, variables, equations, tuple(steps), kind, solution)
+
+
+# --- Formatting helpers ---
+
+def _name(index):
+    return f"the {ORDINALS[index]} equation" if index < len(ORDINALS) else f"equation {index + 1}"
+
+
+def _point(values):
+    return "(" + ", ".join(str(value) for value in values) + ")"
+
+
+def _plugged(coef, value):
+    """A ``format_terms`` pair for ``coef`` times a known value: ``3(2)`` or ``8``."""
+    if abs(coef) == 1 and value >= 0:
+        return str(value), coef
+    return f"({value})", coef
+
+
+def _display(row, variables, var):
+    """An equation as written: solved for ``var`` if given, else standard form."""
+    return format_solved(row, variables, var) if var else format_equation(row, variables)
+
+
+def _solve_lines(var, coef, known, rhs):
+    """Lines taking ``coef*var + known = rhs`` to ``var = value``."""
+    lines = [f"{format_terms([(var, coef), (None, known)])} = {rhs}"]
+    if known:
+        lines.append(f"{format_terms([(var, coef)])} = {rhs - known}")
+    if coef != 1:
+        lines.append(f"{var} = {(rhs - known) / coef}")
+    return lines, (rhs - known) / coef
+
+
+def _dedupe(lines):
+    return [line for index, line in enumerate(lines) if not index or line != lines[index - 1]]
+
+
+def _verdict(known, rhs):
+    return f"{known} = {rhs}  ← {'TRUE!' if known == rhs else 'FALSE!'}"
+
+
+def _check_step(rows, variables, values, isolated):
+    bullets = []
+    for index, (row, var) in enumerate(zip(rows, isolated)):
+        total = sum(coef * value for coef, value in zip(row, values))
+        mark = "✓" if total == row[-1] else "✗"
+        if var:
+            at = variables.index(var)
+            terms = [_plugged(-coef / row[at], value) for other, coef, value in zip(variables, row, values)
+                     if other != var and coef]
+            right = format_terms(terms + [(None, row[-1] / row[at])])
+            bullets.append(f"Equation {index + 1}: {var} = {right} = {values[at]} {mark}")
+        else:
+            left = format_terms(_plugged(coef, value) for coef, value in zip(row, values) if coef)
+            bullets.append(f"Equation {index + 1}: {left} = {total} {mark}")
+    return Step(f"Check the solution {_point(values)}", bullets=bullets)
+
+
+def _sentence(text):
+    return text[0].upper() + text[1:]
+
+
+def _scale_steps(given, rows, variables, isolated):
+    """A step rescaling equations written in standard form to ``rows``, if any change."""
+    phrases, work = [], []
+    for index, (original, row, var) in enumerate(zip(given, rows, isolated)):
+        # Solved forms read the same at any scale, so they are left alone.
+        if var or original == row:
+            continue
+        factor = next(new / old for new, old in zip(row, original) if old)
+        if factor.numerator == 1:
+            phrases.append(f"divide {_name(index)} by {factor.denominator}")
+        else:
+            phrases.append(f"multiply {_name(index)} by {factor}")
+        work.append(f"{format_equation(original, variables)}  →  {format_equation(row, variables)}")
+    return [Step(_sentence(" and ".join(phrases)), work)] if work else []
+
+
+# --- Substitution ---
+
+def _substitution(rows, variables, isolated):
+    def cost(choice):
+        i, j = choice
+        coef = rows[i][j]
+        return (isolated[i] != variables[j], not rows[1 - i][j], abs(coef) != 1, abs(coef), i)
+
+    i, j = min(((i, j) for i in range(2) for j in range(2) if rows[i][j]), key=cost)
+    k = 1 - i
+    v, w = variables[j], variables[1 - j]
+    a, b, c = rows[i][j], rows[i][1 - j], rows[i][2]
+    slope, const = -b / a, c / a
+    expr = format_terms([(w, slope), (None, const)])
+    steps = []
+
+    if isolated[i] == v:
+        steps.append(Step(f"{_sentence(_name(i))} is already solved for {v} ✓"))
+    else:
+        work = [format_equation(rows[i], variables)]
+        if b:
+            work.append(f"{format_terms([(v, a)])} = {format_terms([(w, -b), (None, c)])}")
+        if a != 1:
+            work.append(f"{v} = {expr}")
+        steps.append(Step(f"Solve {_name(i)} for {v}", _dedupe(work)))
+
+    p, q, s = rows[k][j], rows[k][1 - j], rows[k][2]
+
+    def in_order(v_terms):
+        return v_terms + [(w, q)] if j == 0 else [(w, q)] + v_terms
+
+    substituted = f"{format_terms(in_order([(f'({expr})', p)]))} = {s}"
+    steps.append(Step(f"Substitute {v} = {expr} into {_name(k)}", [substituted]))
+
+    coef, known = p * slope + q, p * const
+    work = [f"{format_terms(in_order([(w, p * slope), (None, known)]))} = {s}"]
+    if not coef:
+        work.append(_verdict(known, s))
+        steps.append(Step(f"Solve for {w}", _dedupe(work)))
+        return steps, solver.INFINITE if known == s else solver.NO_SOLUTION, None
+    lines, w_value = _solve_lines(w, coef, known, s)
+    steps.append(Step(f"Solve for {w}", _dedupe(work + lines)))
+
+    v_value = slope * w_value + const
+    work = [f"{v} = {format_terms([_plugged(slope, w_value), (None, const)])}"]
+    if slope and const:
+        work.append(f"{v} = {format_terms([(None, slope * w_value), (None, const)])}")
+    work.append(f"{v} = {v_value}")
+    steps.append(Step(f"Substitute {w} = {w_value} back into {v} = {expr}", _dedupe(work)))
+
+    values = (v_value, w_value) if j == 0 else (w_value, v_value)
+    return steps, solver.UNIQUE, values
+
+
+# --- Elimination ---
+
+def _elimination(rows, variables, isolated):
+    steps = []
+    if any(isolated):
+        work = [f"{_display(row, variables, var)}  →  {format_equation(row, variables)}"
+                for row, var in zip(rows, isolated) if var]
+        steps.append(Step("Write each equation in standard form", work))
+    labelled = [(_name(i), row) for i, row in enumerate(rows)]
+    kind, known = _eliminate(labelled, list(range(len(variables))), variables, steps, iter("ABCDEFGHIJKLMNOP"))
+    if kind != solver.UNIQUE:
+        return steps, kind, None
+    values = tuple(known[index] for index in range(len(variables)))
+    return steps, kind, values
+
+
+def _multipliers(pivot, row, j):
+    """Multipliers making ``pivot`` and ``row`` cancel in column ``j``."""
+    size = math.lcm(int(abs(pivot[j])), int(abs(row[j])))
+    sign = 1 if (pivot[j] > 0) != (row[j] > 0) else -1
+    return size // int(abs(pivot[j])), sign * size // int(abs(row[j]))
+
+
+def _eliminate(labelled, active, variables, steps, letters):
+    """Append steps eliminating ``active`` variables; returns ``(kind, values by index)``."""
+    if not labelled:
+        return solver.INFINITE, None
+    if len(active) == 1:
+        j = active[0]
+        row = labelled[0][1]
+        if row[j] != 1:
+            lines, value = _solve_lines(variables[j], row[j], 0, row[-1])
+            steps.append(Step(f"Solve for {variables[j]}", lines))
+        return solver.UNIQUE, {j: row[-1] / row[j]}
+
+    def cost(choice):
+        j, p = choice
+        pivot = labelled[p][1]
+        total = sum(sum(map(abs, _multipliers(pivot, row, j)))
+                    for index, (_, row) in enumerate(labelled) if index != p and row[j])
+        return total, j, p
+
+    j, p = min(((j, p) for j in active for p, (_, row) in enumerate(labelled) if row[j]), key=cost)
+    v = variables[j]
+    pivot_label, pivot = labelled[p]
+    remaining = []
+    for index, (label, row) in enumerate(labelled):
+        if index == p:
+            continue
+        if not row[j]:
+            remaining.append((label, row))
+            continue
+        mp, mo = _multipliers(pivot, row, j)
+        combined = tuple(mp * a + mo * b for a, b in zip(pivot, row))
+        work = [format_equation([mp * a for a in pivot], variables),
+                format_equation([mo * b for b in row], variables)]
+        if not any(combined[:-1]):
+            result = _verdict(0, combined[-1])
+        else:
+            result = format_equation(combined, variables)
+            if len(active) > 2:
+                label_new = f"({next(letters)})"
+                result += f"  ... {label_new}"
+                remaining.append((label_new, combined))
+            else:
+                remaining.append((label, combined))
+        work += ["_" * max(map(len, work)), result]
+        scaled = [f"multiply {name} by {m}" for name, m in ((pivot_label, mp), (label, mo)) if m != 1]
+        if scaled:
+            title = f"{_sentence(' and '.join(scaled))}, then add to eliminate {v}"
+        else:
+            title = f"Add {pivot_label} and {label} to eliminate {v}"
+        steps.append(Step(title, work))
+        if not any(combined[:-1]) and combined[-1]:
+            return solver.NO_SOLUTION, None
+
+    kind, known = _eliminate(remaining, [index for index in active if index != j], variables, steps, letters)
+    if kind != solver.UNIQUE:
+        return kind, known
+
+    others = [index for index in active if index != j]
+    terms = [(v, pivot[index]) if index == j else _plugged(pivot[index], known[index])
+             for index in active if pivot[index]]
+    work = [f"{format_terms(terms)} = {pivot[-1]}"]
+    lines, known[j] = _solve_lines(v, pivot[j], sum(pivot[index] * known[index] for index in others), pivot[-1])
+    assignments = ", ".join(f"{variables[index]} = {known[index]}" for index in sorted(others))
+    steps.append(Step(f"Substitute {assignments} into {pivot_label}", _dedupe(work + lines)))
+    return kind, known
+
+
+# --- Graphing ---
+
+def _graphing(rows, variables, isolated):
+    x, y = variables
+    forms, work, steps = [], [], []
+    for i, (a, b, c) in enumerate(rows):
+        if b:
+            slope, intercept = -a / b, c / b
+            form = f"{y} = {format_terms([(x, slope), (None, intercept)])}"
+            if isolated[i] != y:
+                lines = [format_equation((a, b, c), variables)]
+                if a:
+                    lines.append(f"{format_terms([(y, b)])} = {format_terms([(x, -a), (None, c)])}")
+                lines.append(form)
+                work += ([""] if work else []) + _dedupe(lines)
+        else:
+            form = f"{x} = {c / a}"
+            if a != 1:
+                work += ([""] if work else []) + [format_equation((a, b, c), variables), form]
+        forms.append(form)
+    if work:
+        steps.append(Step(f"Write each equation in slope-intercept form ({y} = mx + b)", work))
+    else:
+        steps.append(Step("Both equations are already in slope-intercept form ✓"))
+
+    for (a, b, c), form in zip(rows, forms):
+        if not b:
+            bullets = [f"Vertical line through ({c / a}, 0)"]
+        else:
+            slope, intercept = -a / b, c / b
+            bullets = [f"{y}-intercept: (0, {intercept})"]
+            if slope:
+                bullets.append(f"slope: {slope} (rise {slope.numerator}, run {slope.denominator})")
+                bullets.append(f"Another point: ({slope.denominator}, {intercept + slope.numerator})")
+            else:
+                bullets.append("slope: 0 (horizontal line)")
+        steps.append(Step(f"Graph {form}", bullets=bullets))
+
+    solution = solver.solve(rows)
+    if solution.kind == solver.UNIQUE:
+        values = solution.values
+        bullets = [f"The lines cross at {_point(values)}"]
+        if any(value.denominator != 1 for value in values):
+            bullets.append("That point is off the grid lines, so a graph only estimates it; "
+                           "confirm it with substitution or elimination")
+    elif solution.kind == solver.NO_SOLUTION:
+        values = None
+        bullets = ["Same slope, different intercepts: the lines are parallel and never cross"]
+    else:
+        values = None
+        bullets = ["Same slope and intercept: both equations draw the same line"]
+    steps.append(Step("Find the intersection point", bullets=bullets, plot=tuple(forms)))
+    return steps, solution.kind, values
+
+
+_TRACERS = {"substitution": _substitution, "elimination": _elimination, "graphing": _graphing}
+
+
+# --- Rendering ---
+
+def trace_blocks(trace):
+    """Content blocks for ``trace``, laid out like the tutorial's worked examples."""
+    system = "\n".join(trace.equations)
+    blocks = [{"type": "markdown", "text": f"**{INTRODUCTIONS[trace.method]}**\n```\n{system}\n```"}]
+    for number, step in enumerate(trace.steps, 1):
+        text = f"**Step {number}:** {step.title}"
+        if step.work:
+            text += "\n```\n" + "\n".join(step.work) + "\n```"
+        if step.bullets:
+            text += "\n" + "\n".join(f"- {bullet}" for bullet in step.bullets)
+        blocks.append({"type": "markdown", "text": text})
+        if step.plot:
+            blocks.append({"type": "plot", "equations": list(step.plot), "variables": trace.variables})
+    lines = len(trace.variables) == 2
+    if trace.kind == solver.UNIQUE:
+        blocks.append({"type": "success", "text": f"**Solution: {_point(trace.solution)}**"})
+    elif trace.kind == solver.NO_SOLUTION:
+        blocks.append({"type": "warning", "text": "**Answer:** No solution" + (" (parallel lines)" if lines else "")})
+    else:
+        blocks.append({"type": "success", "text": "**Answer:** Infinite solutions" + (" (same line)" if lines else "")})
+    return blocks
+
+
+def render_trace(trace):
+    render_blocks(trace_blocks(trace))
@@ -0,0 +1,195 @@
+"""Check every worked example in ``content/`` against the exact solver.
+
+Each section source is split into scopes: a practice problem, or the text
+between headers, subheaders and dividers.  In each scope the first square
+system is taken either from a code fence (consecutive equation lines) or
+from a word problem's ``→ **equation**`` bullets, and compared with the
+first stated answer (``Solution: (2, 3)``, ``Answer: No solution``,
+``Answer: 22 chickens and 8 cows``).  Word-problem numbers are read in the
+system's variable order.  All systems are solved together with
+``solver.solve_batch``.
+
+``python -m tutorial.verify`` prints every mismatch and exits with status 1
+if there are any; ``tutorial.build_assets`` runs it after compiling the
+content pack, and ``tests/test_verify.py`` runs it with the test suite.
+"""
+import re
+import sys
+from collections import namedtuple
+from fractions import Fraction
+
+from tutorial import solver
+from tutorial.content import CONTENT_DIR, _DIRECTIVE
+from tutorial.equations import parse_system
+from tutorial.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+SCOPE_DIRECTIVES = {"header", "subheader", "divider", "problem", "part"}
+
+_ARROW_EQUATION = re.compile(r"→\s*\*\*(.+?)\*\*")
+# Trailing notes on equation lines: "(total animals)", "... (A)", "← FALSE!".
+_NOTE = re.compile(r"\s*(?:\([^)]*[a-z]{2}[^)]*\)|\.\.\..*|←.*)$")
+_ANSWER = re.compile(r"\b(?:Solution|Answer)(?: \([^)]*\))?:\**\s*(.*)")
+_TUPLE = re.compile(r"\(([^()]*)\)")
+_VALUE = re.compile(r"(?<![\d.])-?\d+(?:\.\d+)?(?:/\d+)?(?![\d%]|\.\d)")
+
+# source/line locate the system; answer is (kind, values or None).
+Example = namedtuple("Example", ["source", "line", "title", "variables", "rows", "answer_line", "answer"])
+
+
+def _value(text):
+    num, _, den = text.partition("/")
+    return Fraction(num) / Fraction(den or 1)
+
+
+def parse_answer(text, n_vars):
+    """Read a stated answer as ``(kind, values)``; None if it states nothing."""
+    text = text.replace("*", "")
+    lowered = text.lower()
+    if "no solution" in lowered:
+        return solver.NO_SOLUTION, None
+    if "infinite" in lowered:
+        return solver.INFINITE, None
+    for group in _TUPLE.findall(text):
+        items = [item.strip() for item in group.split(",")]
+        if len(items) > 1 and all(_VALUE.fullmatch(item) for item in items):
+            return solver.UNIQUE, tuple(_value(item) for item in items)
+    values = [_value(item) for item in _VALUE.findall(text)]
+    if len(values) == 1 and " each" in lowered:
+        values *= n_vars
+    if not values:
+        return None
+    return solver.UNIQUE, tuple(values)
+
+
+def _system(lines):
+    """``(variables, rows)`` if ``lines`` form a square system, else None."""
+    try:
+        variables, rows = parse_system(lines)
+    except ValueError:
+        return None
+    return (variables, rows) if len(variables) == len(rows) else None
+
+
+def _equation_runs(lines):
+    """Yield runs of consecutive lines that each read as an equation."""
+    run = []
+    for lineno, line in lines:
+        line = _NOTE.sub("", line).strip()
+        if line and _parses(line):
+            run.append((lineno, line))
+            continue
+        if len(run) > 1:
+            yield run
+        run = []
+    if len(run) > 1:
+        yield run
+
+
+def _parses(line):
+    try:
+        parse_system([line])
+    except ValueError:
+        return False
+    return True
+
+
+def extract(text, source="<content>"):
+    """Yield an ``Example`` for every scope in ``text`` with a system and an answer."""
+    scopes = []
+    scope = None
+    title = ""
+    in_fence = False
+    pending_title = False
+    for lineno, line in enumerate(text.splitlines(), 1):
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            in_fence = not in_fence
+            if in_fence:
+                scope["fences"].append([])
+            continue
+        if in_fence:
+            scope["fences"][-1].append((lineno, line))
+            continue
+        match = _DIRECTIVE.match(stripped)
+        if match:
+            end, kind, arg = match.groups()
+            if kind in SCOPE_DIRECTIVES or scope is None:
+                if kind == "problem" and not end:
+                    title = arg.split("|", 1)[1].strip()
+                pending_title = kind in ("header", "subheader") and not end
+                scope = {"title": title, "fences": [], "arrows": [[]], "answers": []}
+                scopes.append(scope)
+            continue
+        if pending_title and stripped:
+            title = scope["title"] = stripped
+            pending_title = False
+            continue
+        arrow = _ARROW_EQUATION.search(line)
+        if arrow:
+            scope["arrows"][-1].append((lineno, arrow.group(1)))
+        elif scope["arrows"][-1]:
+            scope["arrows"].append([])
+        answer = _ANSWER.search(line)
+        if answer and answer.group(1).strip("* "):
+            scope["answers"].append((lineno, answer.group(1)))
+
+    for scope in scopes:
+        if not scope["answers"]:
+            continue
+        runs = [run for lines in scope["fences"] + scope["arrows"] for run in _equation_runs(lines)]
+        systems = [(run, _system([line for _, line in run])) for run in sorted(runs)]
+        systems = [(run, system) for run, system in systems if system]
+        if not systems:
+            continue
+        run, (variables, rows) = systems[0]
+        answer_line, answer_text = scope["answers"][0]
+        yield Example(source, run[0][0], scope["title"], variables, rows,
+                      answer_line, parse_answer(answer_text, len(variables)))
+
+
+def solve_examples(examples):
+    """Solve every example's system in batches by size; returns ``(kind, values)`` per example."""
+    results = [None] * len(examples)
+    by_size = {}
+    for index, example in enumerate(examples):
+        by_size.setdefault(len(example.variables), []).append(index)
+    for indices in by_size.values():
+        matrices = np.array([solver.integer_rows(examples[i].rows) for i in indices], dtype=np.int64)
+        kinds, nums, dens = solver.solve_batch(matrices[:, :, :-1], matrices[:, :, -1])
+        for i, kind, num, den in zip(indices, kinds, nums, dens):
+            values = tuple(Fraction(int(n), int(den)) for n in num) if kind == solver.UNIQUE else None
+            results[i] = (int(kind), values)
+    return results
+
+
+def _describe(result, variables):
+    kind, values = result
+    if kind != solver.UNIQUE or values is None:
+        return solver.KIND_NAMES[kind]
+    return "(" + ", ".join(f"{v} = {value}" for v, value in zip(variables, values)) + ")"
+
+
+def verify(content_dir=CONTENT_DIR):
+    """Return ``(examples, mismatches)``; each mismatch is ``(example, computed)``."""
+    examples = []
+    for path in sorted(content_dir.glob("*.md")):
+        examples += extract(path.read_text(encoding="utf-8"), f"{content_dir.name}/{path.name}")
+    results = solve_examples(examples)
+    mismatches = [(example, result) for example, result in zip(examples, results) if example.answer != result]
+    return examples, mismatches
+
+
+def main():
+    examples, mismatches = verify()
+    for example, computed in mismatches:
+        stated = "unreadable" if example.answer is None else _describe(example.answer, example.variables)
+        print(f"{example.source}:{example.answer_line}: {example.title}")
+        print(f"    system at line {example.line} gives {_describe(computed, example.variables)}, stated {stated}")
+    print(f"{len(examples)} worked examples checked, {len(mismatches)} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())